@@ -2,14 +2,25 @@
 
 import os
 from datetime import timedelta
+from types import MappingProxyType
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from dotenv import load_dotenv
 
-load_dotenv()
+# 운영 환경에서는 컨테이너/오케스트레이터가 환경 변수를 직접 주입하므로
+# .env 파일 파싱을 생략합니다. DOTENV_LOADED 플래그로 워커 포크 시
+# 중복 로딩도 방지합니다.
+if os.getenv("APP_ENV") != "production" and not os.getenv("DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["DOTENV_LOADED"] = "1"
+
+# 환경 변수를 모듈 로드 시 한 번만 평문 dict로 스냅샷합니다.
+# os.environ 접근은 매번 C 게터를 거치므로, 이후의 모든 설정값은
+# 이 dict에서 읽어 반복 조회 비용을 없앱니다.
+_ENV = dict(os.environ)
 
 logging_config = {
-    "level": os.getenv("LOG_LEVEL", "INFO"),
+    "level": _ENV.get("LOG_LEVEL", "INFO"),
     "format": "[%(asctime)s] %(levelname)s %(message)s",
 }
 
@@ -21,58 +32,59 @@ except ZoneInfoNotFoundError:
     TZ = timezone(timedelta(hours=9))
 
 # 분석할 시장 (KS: KOSPI, KQ: KOSDAQ)
-MARKET = os.getenv("MARKET", "KS")
-NEWS_MAX = int(os.getenv("NEWS_MAX", "3"))
+MARKET = _ENV.get("MARKET", "KS")
+NEWS_MAX = int(_ENV.get("NEWS_MAX", "3"))
 
 # 감성 분석에 사용할 HuggingFace 모델 ID
-SENTIMENT_MODEL_ID = os.getenv("SENTIMENT_MODEL", "snunlp/KR-FinBert-SC")
+SENTIMENT_MODEL_ID = _ENV.get("SENTIMENT_MODEL", "snunlp/KR-FinBert-SC")
 
 # 공공데이터포털 API 서비스 키
-DATA_GO_KR_API_KEY = os.getenv("DATA_GO_KR_API_KEY")
+DATA_GO_KR_API_KEY = _ENV.get("DATA_GO_KR_API_KEY")
 
 # 데이터베이스 접속 URL
-DATABASE_URL = os.getenv("DATABASE_URL")
+DATABASE_URL = _ENV.get("DATABASE_URL")
 
 # 사용할 LLM 모델 이름
-LLM_MODEL_NAME = os.getenv("LLM_MODEL_NAME", "gpt-4-turbo")
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+LLM_MODEL_NAME = _ENV.get("LLM_MODEL_NAME", "gpt-4-turbo")
+OPENAI_API_KEY = _ENV.get("OPENAI_API_KEY")
 
 # Redis 접속 URL
-REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+REDIS_URL = _ENV.get("REDIS_URL", "redis://localhost:6379/0")
 
 # 데이터 캐시 디렉토리
-CACHE_DIR = os.getenv("CACHE_DIR", ".cache")
+CACHE_DIR = _ENV.get("CACHE_DIR", ".cache")
 
 # 유니버스 필터링을 위한 최소 거래대금 (단위: 원, 기본값: 10억)
-UNIVERSE_MIN_TURNOVER_WON = float(os.getenv("UNIVERSE_MIN_TURNOVER_WON", "1e9"))
+UNIVERSE_MIN_TURNOVER_WON = float(_ENV.get("UNIVERSE_MIN_TURNOVER_WON", "1e9"))
 
 # 감성 분석 관련 설정값
 # '중립'으로 판단하는 신뢰도 임계값
 SENTIMENT_CONFIDENCE_THRESHOLD_NEUTRAL = float(
-    os.getenv("SENTIMENT_CONFIDENCE_THRESHOLD_NEUTRAL", "0.55")
+    _ENV.get("SENTIMENT_CONFIDENCE_THRESHOLD_NEUTRAL", "0.55")
 )
 
 # '강력한'으로 판단하는 신뢰도 임계값
 SENTIMENT_CONFIDENCE_THRESHOLD_STRONG = float(
-    os.getenv("SENTIMENT_CONFIDENCE_THRESHOLD_STRONG", "0.99")
+    _ENV.get("SENTIMENT_CONFIDENCE_THRESHOLD_STRONG", "0.99")
 )
-SENTIMENT_BATCH_SIZE = int(os.getenv("SENTIMENT_BATCH_SIZE", "16"))
+SENTIMENT_BATCH_SIZE = int(_ENV.get("SENTIMENT_BATCH_SIZE", "16"))
 SENTIMENT_NEWS_WEIGHT_DECAY_RATE = float(
-    os.getenv("SENTIMENT_NEWS_WEIGHT_DECAY_RATE", "0.2")
+    _ENV.get("SENTIMENT_NEWS_WEIGHT_DECAY_RATE", "0.2")
 )
 
 # 네이버 API credentials
-NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID")
-NAVER_CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET")
+NAVER_CLIENT_ID = _ENV.get("NAVER_CLIENT_ID")
+NAVER_CLIENT_SECRET = _ENV.get("NAVER_CLIENT_SECRET")
 
 # Scoring 상수
-RSI_OVERSOLD = int(os.getenv("RSI_OVERSOLD", "30"))
-RSI_OVERBOUGHT = int(os.getenv("RSI_OVERBOUGHT", "70"))
-RSI_STRONG_OVERBOUGHT = int(os.getenv("RSI_STRONG_OVERBOUGHT", "80"))
-RSI_EXTREME_OVERBOUGHT = int(os.getenv("RSI_EXTREME_OVERBOUGHT", "90"))
+RSI_OVERSOLD = int(_ENV.get("RSI_OVERSOLD", "30"))
+RSI_OVERBOUGHT = int(_ENV.get("RSI_OVERBOUGHT", "70"))
+RSI_STRONG_OVERBOUGHT = int(_ENV.get("RSI_STRONG_OVERBOUGHT", "80"))
+RSI_EXTREME_OVERBOUGHT = int(_ENV.get("RSI_EXTREME_OVERBOUGHT", "90"))
 
 # Strategy 설정 (투자 전략에 따른 가중치 설정값)
-STRATEGY_CONFIG = {
+# 읽기 전용 뷰로 감싸 하위 모듈에서의 변조를 막고 불변임을 명시합니다.
+STRATEGY_CONFIG = MappingProxyType({
     "day_trader": {
         "mom_weights": (0.5, 0.2, 0.0),
         "vol_penalty_weight": 0.2,
@@ -88,4 +100,4 @@ STRATEGY_CONFIG = {
         "vol_penalty_weight": 0.5,
         "news_impact_factor": 0.2,
     },
-}
+})
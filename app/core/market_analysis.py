@@ -1,14 +1,24 @@
 # app/core/market_analysis.py
 
-import logging
+from __future__ import annotations
 
-import httpx
-import redis.asyncio as redis
+import logging
+from typing import TYPE_CHECKING
 
 from app.config import MARKET
 
 from ..services.market_data import fetch_ohlcv
 
+# httpx/redis는 타입 힌트에서만 사용되므로 워커 콜드 스타트 시
+# 임포트 비용을 지불하지 않도록 타입 체크 시에만 로드합니다.
+if TYPE_CHECKING:
+    import httpx
+    import redis.asyncio as redis
+
+
+# ETF 종가는 장중에 바뀌지 않으므로 판단 결과를 짧게 캐시해도 안전합니다.
+_REGIME_CACHE_TTL_SECONDS = 300
+
 
 async def determine_market_regime(
     client: httpx.AsyncClient, redis_conn: redis.Redis, as_of: str
@@ -18,6 +28,16 @@ async def determine_market_regime(
     # KOSPI: KODEX 200, KOSDAQ: KODEX KOSDAQ 150
     market_index_ticker = "069500.KS" if MARKET.upper() == "KS" else "229200.KS"
 
+    cache_key = f"market-regime:{as_of}"
+    try:
+        cached_regime = await redis_conn.get(cache_key)
+        if isinstance(cached_regime, bytes):
+            cached_regime = cached_regime.decode("utf-8")
+        if cached_regime in ("BULL", "BEAR", "NEUTRAL"):
+            return cached_regime
+    except Exception as e:
+        logging.warning(f"시장 상황 캐시 조회 실패: {e}. 직접 계산합니다.")
+
     try:
         market_index_data = await fetch_ohlcv(
             client, redis_conn, [market_index_ticker], end_date=as_of, lookback_days=30
@@ -25,8 +45,11 @@ async def determine_market_regime(
         df_index = market_index_data.get(market_index_ticker)
 
         if df_index is not None and not df_index.empty and len(df_index) >= 20:
-            last_close = df_index["close"].iloc[-1]
-            ma20 = df_index["close"].rolling(window=20).mean().iloc[-1]
+            # 마지막 시점의 스칼라 하나만 필요하므로 rolling Series를 만들지 않고
+            # 종가 배열 꼬리 20개의 평균만 계산합니다.
+            closes = df_index["close"].to_numpy()
+            last_close = closes[-1]
+            ma20 = closes[-20:].mean()
 
             if last_close > ma20:
                 market_regime = "BULL"
@@ -36,6 +59,13 @@ async def determine_market_regime(
             logging.info(
                 f"시장 상황 판단: {market_regime} (종가: {last_close:.2f}, MA20: {ma20:.2f})"
             )
+
+            try:
+                await redis_conn.set(
+                    cache_key, market_regime, ex=_REGIME_CACHE_TTL_SECONDS
+                )
+            except Exception as e:
+                logging.warning(f"시장 상황 캐시 저장 실패: {e}")
     except Exception as e:
         logging.warning(f"시장 상황 판단 실패: {e}. 'NEUTRAL'로 진행합니다.")
 
@@ -1,5 +1,9 @@
 # app/core/presentation.py
 
+import bisect
+
+import numpy as np
+
 from ..config import (
     RSI_EXTREME_OVERBOUGHT,
     RSI_OVERBOUGHT,
@@ -9,39 +13,88 @@ from ..config import (
 from ..schemas.models import RecoItem, StockScore
 
 
+# 모멘텀(m5) 구간별 문구: bisect 인덱스가 곧 메시지 인덱스가 되도록
+# 경계(_M5_BANDS)와 오름차순으로 정렬해 둡니다.
+_M5_BANDS = (0.0, 0.05, 0.15)
+_M5_MESSAGES = (
+    "단기적으로 조정을 받고 있으나,",
+    "완만한 상승 흐름을 보이는 가운데,",
+    "탄탄한 상승 추세를 이어가고 있으며,",
+    "최근 주가가 급등하여 기세가 아주 강하며,",
+)
+
+# RSI 구간별 문구 템플릿 (침체 / 건전 / 과열 / 초과열 순)
+_RSI_MESSAGES = (
+    "RSI({rsi:.0f})가 침체권이라 기술적 '반등'이 기대되는 자리입니다.",
+    "과열되지 않은 건전한 수급(RSI {rsi:.0f})을 유지하고 있습니다.",
+    "RSI({rsi:.0f})가 과열권에 진입해 잠시 쉬어갈 수 있습니다.",
+    "RSI({rsi:.0f})가 초과열권이라 '매도' 압력이 커질 수 있어 주의가 필요합니다.",
+)
+
+
 def generate_friendly_reason(stock_score: StockScore) -> str:
-    """수치 데이터를 바탕으로 친절한 설명 문구를 생성합니다."""
+    """수치 데이터를 바탕으로 친절한 설명 문구를 생성합니다.
+
+    if/elif 사다리 대신 구간 경계 테이블을 인덱싱하여 문구를 선택합니다.
+    """
     mom = stock_score.momentum
     m5 = mom.get("m5", 0.0)
     rsi = mom.get("rsi", 50.0)
 
-    parts = []
-
-    # 1. 모멘텀(추세) 평가
-    if m5 > 0.15:
-        parts.append("최근 주가가 급등하여 기세가 아주 강하며,")
-    elif m5 > 0.05:
-        parts.append("탄탄한 상승 추세를 이어가고 있으며,")
-    elif m5 > 0:
-        parts.append("완만한 상승 흐름을 보이는 가운데,")
-    else:
-        parts.append("단기적으로 조정을 받고 있으나,")
-
-    # 2. RSI(과열/침체) 평가
-    if rsi >= RSI_STRONG_OVERBOUGHT:
-        parts.append(
-            f"RSI({rsi:.0f})가 초과열권이라 '매도' 압력이 커질 수 있어 주의가 필요합니다."
+    # 1. 모멘텀(추세) 평가: 이진 탐색으로 구간 인덱스 결정
+    m5_part = _M5_MESSAGES[bisect.bisect_left(_M5_BANDS, m5)]
+
+    # 2. RSI(과열/침체) 평가: 경계 조건(<=30 / >=70 / >=80)이 비대칭이라
+    #    비교 결과 합산으로 인덱스를 계산합니다.
+    rsi_idx = (
+        (rsi > RSI_OVERSOLD)
+        + (rsi >= RSI_OVERBOUGHT)
+        + (rsi >= RSI_STRONG_OVERBOUGHT)
+    )
+    rsi_part = _RSI_MESSAGES[rsi_idx].format(rsi=rsi)
+
+    return f"{m5_part} {rsi_part}"
+
+
+# 시장 상황별 별점 임계값 (요청마다 dict를 다시 만들지 않도록 모듈 상수로 유지)
+_STAR_THRESHOLDS = {
+    "BULL": (60, 70, 80, 90),
+    "NEUTRAL": (65, 75, 85, 95),
+    "BEAR": (70, 80, 90, 97),
+}
+
+
+def _has_strong_negative_news(news_sentiment) -> bool:
+    """뉴스 감성 결과에 '강력한 악재'가 포함되어 있는지 확인합니다.
+
+    감성 분석 단계에서 미리 판정한 strong_negative 플래그를 우선 사용하고,
+    플래그가 없는 레거시 페이로드만 details를 순회합니다.
+    """
+    if not news_sentiment:
+        return False
+    flag = (
+        news_sentiment.get("strong_negative")
+        if isinstance(news_sentiment, dict)
+        else getattr(news_sentiment, "strong_negative", None)
+    )
+    if flag is not None:
+        return bool(flag)
+    details = (
+        news_sentiment.get("details")
+        if isinstance(news_sentiment, dict)
+        else getattr(news_sentiment, "details", None)
+    )
+    if not details:
+        return False
+    for detail in details:
+        label = (
+            detail.get("label")
+            if isinstance(detail, dict)
+            else getattr(detail, "label", "")
         )
-    elif rsi >= RSI_OVERBOUGHT:
-        parts.append(f"RSI({rsi:.0f})가 과열권에 진입해 잠시 쉬어갈 수 있습니다.")
-    elif rsi <= RSI_OVERSOLD:
-        parts.append(
-            f"RSI({rsi:.0f})가 침체권이라 기술적 '반등'이 기대되는 자리입니다."
-        )
-    else:
-        parts.append(f"과열되지 않은 건전한 수급(RSI {rsi:.0f})을 유지하고 있습니다.")
-
-    return " ".join(parts)
+        if label == "강력한 악재":
+            return True
+    return False
 
 
 def calculate_stock_stars(item: RecoItem, market_regime: str) -> int:
@@ -49,28 +102,17 @@ def calculate_stock_stars(item: RecoItem, market_regime: str) -> int:
     score = item.score
     rsi = item.momentum.get("rsi", 50.0)
 
-    thresholds = {
-        "BULL": [60, 70, 80, 90],
-        "NEUTRAL": [65, 75, 85, 95],
-        "BEAR": [70, 80, 90, 97],
-    }.get(market_regime, [65, 75, 85, 95])
-
-    stars = 1
-    if score >= thresholds[3]:
-        stars = 5
-    elif score >= thresholds[2]:
-        stars = 4
-    elif score >= thresholds[1]:
-        stars = 3
-    elif score >= thresholds[0]:
-        stars = 2
+    thresholds = _STAR_THRESHOLDS.get(market_regime, _STAR_THRESHOLDS["NEUTRAL"])
+
+    # if/elif 사다리 대신 이진 탐색 한 번으로 별점 구간을 결정
+    stars = bisect.bisect_right(thresholds, score) + 1
 
     # 리스크 필터 (RSI, 뉴스 악재 등)
     if rsi >= RSI_STRONG_OVERBOUGHT:
         stars = min(stars, 4)
     if rsi >= RSI_EXTREME_OVERBOUGHT:
         stars = min(stars, 3)
-    if item.news_sentiment and "강력한 악재" in str(item.news_sentiment):
+    if _has_strong_negative_news(item.news_sentiment):
         stars = min(stars, 3)
 
     return stars
@@ -100,25 +142,66 @@ def scale_to_100(
     return int(final_score)
 
 
+def scale_to_100_batch(
+    scores: np.ndarray, min_raw: float, max_raw: float, market_regime: str
+) -> np.ndarray:
+    """scale_to_100의 배치 버전: 추천 목록 전체를 NumPy 연산으로 일괄 변환합니다.
+
+    항목별 파이썬 함수 호출 대신 정규화/구간 스케일링을 배열 연산
+    몇 번으로 처리하므로, 후보 수가 많아져도 비용이 거의 늘지 않습니다.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+
+    score_cap = 100
+    if market_regime == "BEAR":
+        score_cap = 80
+    if max_raw < 0.0:
+        score_cap = min(score_cap, 50)
+
+    if max_raw == min_raw:
+        return np.full(scores.shape, 50, dtype=np.int64)
+
+    normalized = (scores - min_raw) / (max_raw - min_raw)
+    scaled = np.where(
+        normalized < 0.2,
+        normalized / 0.2 * 60,
+        60 + (normalized - 0.2) / 0.8 * 40,
+    )
+    return (scaled * (score_cap / 100.0)).astype(np.int64)
+
+
+# 이동평균선 코멘트: (추세 상태, 주가 위치) 9가지 조합의 최종 문자열을
+# 모듈 로드 시 한 번만 조립해 두고, 호출 시에는 dict 조회만 수행합니다.
+_MA_TREND_PARTS = {
+    1: "이동평균선이 정배열(단기>중기>장기)을 이루어 '강력한 상승 추세'를 보이고 있습니다.",
+    -1: "이동평균선이 역배열 상태라 '하락 추세'가 지속되고 있습니다.",
+    0: "",
+}
+_MA_POSITION_PARTS = {
+    1: "현재 주가가 5일선 위에 있어 단기 탄력이 좋습니다.",
+    -1: "주가가 5일선 아래로 내려와 단기 조정을 받고 있습니다.",
+    0: "",
+}
+_MA_COMMENTS = {
+    (trend, pos): (
+        " ".join(p for p in (_MA_TREND_PARTS[trend], _MA_POSITION_PARTS[pos]) if p)
+        or "이동평균선이 혼조세를 보이며 뚜렷한 방향성을 탐색 중입니다."
+    )
+    for trend in (1, 0, -1)
+    for pos in (1, 0, -1)
+}
+
+
 def generate_ma_comment(price: float, ma5: float, ma20: float, ma60: float) -> str:
     """이동평균선 배열 상태와 주가 위치를 분석하여 코멘트를 생성합니다."""
-    parts = []
-
-    # 1. 정배열/역배열 판단 (장기 추세)
+    # 정배열(1)/역배열(-1)/혼조(0) 및 5일선 위(1)/아래(-1)/동일(0) 코드 계산
     if ma5 > ma20 > ma60:
-        parts.append(
-            "이동평균선이 정배열(단기>중기>장기)을 이루어 '강력한 상승 추세'를 보이고 있습니다."
-        )
+        trend = 1
     elif ma5 < ma20 < ma60:
-        parts.append("이동평균선이 역배열 상태라 '하락 추세'가 지속되고 있습니다.")
-
-    # 2. 현재 주가와 이평선 관계 (단기 탄력)
-    if price > ma5:
-        parts.append("현재 주가가 5일선 위에 있어 단기 탄력이 좋습니다.")
-    elif price < ma5:
-        parts.append("주가가 5일선 아래로 내려와 단기 조정을 받고 있습니다.")
-
-    if not parts:
-        parts.append("이동평균선이 혼조세를 보이며 뚜렷한 방향성을 탐색 중입니다.")
+        trend = -1
+    else:
+        trend = 0
+    # bool 뺄셈은 numpy 스칼라 입력에서 지원되지 않으므로 int로 변환해 계산
+    pos = int(price > ma5) - int(price < ma5)
 
-    return " ".join(parts)
+    return _MA_COMMENTS[(trend, pos)]
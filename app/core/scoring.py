@@ -1,41 +1,38 @@
 # app/core/scoring.py
 
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
 from ..schemas.models import FeatureConf, StockScore
 from .strategies import get_strategy
+from .ta_kernels import atr_kernel, rsi_kernel, sma_kernel
 
 
 def compute_rsi(series: pd.Series, period: int = 14) -> pd.Series:
-    """RSI(Relative Strength Index)를 계산합니다. (Wilder's Smoothing 적용)"""
-    delta = series.diff(1)
-    gain = delta.where(delta > 0, 0)
-    loss = -delta.where(delta < 0, 0)
+    """RSI(Relative Strength Index)를 계산합니다. (Wilder's Smoothing 적용)
 
-    # Wilder's Smoothing (alpha = 1/period)
-    avg_gain = gain.ewm(alpha=1 / period, min_periods=period, adjust=False).mean()
-    avg_loss = loss.ewm(alpha=1 / period, min_periods=period, adjust=False).mean()
-
-    rs = avg_gain / avg_loss
-    return 100 - (100 / (1 + rs))
+    pandas ewm 대신 NumPy 배열 위에서 한 번에 도는 Numba 커널을 사용하여
+    종목당 중간 Series 할당과 ewm 디스패치 비용을 제거합니다.
+    """
+    values = rsi_kernel(series.to_numpy(dtype=np.float64), period)
+    return pd.Series(values, index=series.index)
 
 
 def compute_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
-    """ATR(Average True Range)을 계산합니다. (Wilder's Smoothing 적용)"""
-    high = df["high"]
-    low = df["low"]
-    close = df["close"]
-    prev_close = close.shift(1)
-
-    tr1 = high - low
-    tr2 = (high - prev_close).abs()
-    tr3 = (low - prev_close).abs()
+    """ATR(Average True Range)을 계산합니다. (Wilder's Smoothing 적용)
 
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    # Wilder's Smoothing
-    return tr.ewm(alpha=1 / period, min_periods=period, adjust=False).mean()
+    True Range 계산과 스무딩을 하나의 Numba 커널로 융합하여,
+    종목당 DataFrame 할당과 배열 다중 순회를 제거합니다.
+    """
+    values = atr_kernel(
+        df["high"].to_numpy(dtype=np.float64),
+        df["low"].to_numpy(dtype=np.float64),
+        df["close"].to_numpy(dtype=np.float64),
+        period,
+    )
+    return pd.Series(values, index=df.index)
 
 
 def calculate_z_scores(
@@ -57,6 +54,43 @@ def calculate_z_scores(
     return z_scores
 
 
+def prepare_z_stats(
+    mom_stats: Dict[str, Tuple[float, float]],
+) -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray]:
+    """모멘텀 통계를 Z-Score 계산용 배열 형태로 변환합니다.
+
+    `calculate_z_scores`는 종목마다 std > 0 분기와 나눗셈을 반복하므로,
+    코호트 전체에 대해 역수 표준편차(1/std, std<=0이면 0)를 한 번만
+    계산해 두고 이후에는 곱셈만 수행하도록 합니다.
+
+    Returns:
+        (keys, means, inv_stds): 키 순서가 정렬된 튜플과 동일 순서의 배열 쌍
+    """
+    keys = tuple(mom_stats.keys())
+    means = np.array([mom_stats[k][0] for k in keys], dtype=np.float64)
+    stds = np.array([mom_stats[k][1] for k in keys], dtype=np.float64)
+    inv_stds = np.divide(
+        1.0, stds, out=np.zeros_like(stds), where=stds > 0
+    )
+    return keys, means, inv_stds
+
+
+def calculate_z_scores_prepared(
+    features: Mapping[str, float],
+    keys: Tuple[str, ...],
+    means: np.ndarray,
+    inv_stds: np.ndarray,
+) -> Dict[str, float]:
+    """`prepare_z_stats`로 준비된 통계를 사용해 Z-Score를 계산합니다.
+
+    종목별 루프 안에서 호출되는 핫패스이므로 분기 없이
+    (값 - 평균) * (1/std) 형태의 곱셈만 수행합니다.
+    """
+    vals = np.array([float(features.get(k, 0.0)) for k in keys], dtype=np.float64)
+    z = (vals - means) * inv_stds
+    return dict(zip(keys, z.tolist()))
+
+
 def compute_features(df: pd.DataFrame, conf: FeatureConf) -> pd.DataFrame:
     """
     주가 데이터(OHLCV)를 기반으로 기술적 지표(이동평균, 모멘텀, RSI, ATR 등)를 계산합니다.
@@ -68,35 +102,125 @@ def compute_features(df: pd.DataFrame, conf: FeatureConf) -> pd.DataFrame:
     Returns:
         pd.DataFrame: 기술적 지표가 추가된 데이터프레임
     """
-    df = df.copy()
+    # 신규 컬럼들을 dict에 모아 마지막에 assign 한 번으로 붙입니다.
+    # (입력 프레임을 복제하지 않고, 컬럼 단위 __setitem__ 반복도 피함)
+    # 각 컬럼은 연속(contiguous) 배열로 한 번만 추출하여
+    # SMA/RSI/ATR 커널이 모두 같은 버퍼를 재사용하게 합니다.
+    # 채점에 쓰이는 지표들은 배정밀도가 필요 없으므로 float32로 계산해
+    # 메모리 대역폭을 절반으로 줄입니다. (임계값이 0.03, 30, 70 수준)
+    close = np.ascontiguousarray(df["close"].to_numpy(dtype=np.float32))
+    volume = np.ascontiguousarray(df["volume"].to_numpy(dtype=np.float32))
+
+    new_cols = {}
 
     # 1. 수익률 및 이동평균선
-    df["ret1"] = df["close"].pct_change(fill_method=None)
-    df["ma5"] = df["close"].rolling(window=5).mean()
-    df["ma20"] = df["close"].rolling(window=20).mean()
-    df["ma60"] = df["close"].rolling(window=60).mean()  # 장기 추세용
+    # rolling(w).mean() 객체를 매번 만들지 않고 누적합 SMA 커널로 계산
+    new_cols["ret1"] = df["close"].pct_change(fill_method=None)
+    new_cols["ma5"] = sma_kernel(close, 5)
+    new_cols["ma20"] = sma_kernel(close, 20)
+    new_cols["ma60"] = sma_kernel(close, 60)  # 장기 추세용
 
     # 2. 거래량 이동평균
-    df["avg_vol20"] = df["volume"].rolling(window=20).mean()
+    new_cols["avg_vol20"] = sma_kernel(volume, 20)
 
     # 3. 모멘텀
     for win in [conf.mom_short, conf.mom_med, conf.mom_long]:
-        df[f"mom{win}"] = df["close"].pct_change(win, fill_method=None)
+        new_cols[f"mom{win}"] = df["close"].pct_change(win, fill_method=None)
 
     # 4. 기술적 지표 (RSI, ATR)
     # 데이터가 충분한지 확인 후 계산 (최소 14일 + 여유분)
     if len(df) > 20:
-        df["rsi"] = compute_rsi(df["close"], period=14)
-        df["atr"] = compute_atr(df, period=14)
+        high = np.ascontiguousarray(df["high"].to_numpy(dtype=np.float32))
+        low = np.ascontiguousarray(df["low"].to_numpy(dtype=np.float32))
+        new_cols["rsi"] = rsi_kernel(close, 14)
+        new_cols["atr"] = atr = atr_kernel(high, low, close, 14)
 
         # ATR을 주가 대비 비율로 정규화 (ATR%): 가격이 다른 종목끼리 비교하기 위함
-        df["atr_ratio"] = df["atr"] / df["close"]
+        new_cols["atr_ratio"] = atr / close
     else:
         # 데이터 부족 시 기본값 처리
-        df["rsi"] = 50.0
-        df["atr_ratio"] = 0.0
+        new_cols["rsi"] = 50.0
+        new_cols["atr_ratio"] = 0.0
+
+    return df.assign(**new_cols)
+
+
+def compute_features_batch(df_long: pd.DataFrame, conf: FeatureConf) -> pd.DataFrame:
+    """
+    (code, date) MultiIndex 장형(long-format) OHLCV 프레임 전체에 대해
+    기술적 지표를 한 번의 groupby 파이프라인으로 계산합니다.
+
+    종목별로 `compute_features`를 반복 호출하면 rolling/pct_change 디스패치
+    비용을 종목 수만큼 지불하므로, 유니버스 규모가 커질수록 이 배치 경로가
+    유리합니다. RSI/ATR은 종목 경계를 넘지 않도록 그룹 구간별로 Numba
+    커널을 실행합니다.
+
+    Args:
+        df_long (pd.DataFrame): (code, date) MultiIndex OHLCV 데이터프레임
+        conf (FeatureConf): 피쳐 설정 객체
+
+    Returns:
+        pd.DataFrame: 기술적 지표가 추가된 동일 구조의 데이터프레임
+    """
+    out = df_long.sort_index(level=["code", "date"])
+    close_g = out.groupby(level="code", sort=False)["close"]
 
-    return df
+    # 1. 수익률 및 이동평균선 (그룹 단위 일괄 계산)
+    out["ret1"] = close_g.pct_change(fill_method=None)
+    out["ma5"] = close_g.rolling(window=5).mean().droplevel(0)
+    out["ma20"] = close_g.rolling(window=20).mean().droplevel(0)
+    out["ma60"] = close_g.rolling(window=60).mean().droplevel(0)
+
+    # 2. 거래량 이동평균
+    out["avg_vol20"] = (
+        out.groupby(level="code", sort=False)["volume"]
+        .rolling(window=20)
+        .mean()
+        .droplevel(0)
+    )
+
+    # 3. 모멘텀
+    for win in [conf.mom_short, conf.mom_med, conf.mom_long]:
+        out[f"mom{win}"] = close_g.pct_change(win, fill_method=None)
+
+    # 4. 기술적 지표 (RSI, ATR): 그룹 경계 기반으로 커널을 구간 실행
+    # 단일 종목 경로와 동일하게 float32로 계산해 대역폭을 줄입니다.
+    high = out["high"].to_numpy(dtype=np.float32)
+    low = out["low"].to_numpy(dtype=np.float32)
+    close = out["close"].to_numpy(dtype=np.float32)
+    n = len(out)
+
+    rsi = np.full(n, 50.0, dtype=np.float32)
+    atr = np.full(n, np.nan, dtype=np.float32)
+    atr_ratio = np.zeros(n, dtype=np.float32)
+
+    codes = out.index.get_level_values("code").to_numpy()
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    bounds = np.r_[starts, n]
+
+    for s, e in zip(bounds[:-1], bounds[1:]):
+        # 데이터가 충분한 종목만 계산 (최소 14일 + 여유분)
+        if e - s > 20:
+            rsi[s:e] = rsi_kernel(close[s:e], 14)
+            atr[s:e] = atr_kernel(high[s:e], low[s:e], close[s:e], 14)
+            atr_ratio[s:e] = atr[s:e] / close[s:e]
+
+    out["rsi"] = rsi
+    out["atr"] = atr
+    out["atr_ratio"] = atr_ratio
+    return out
+
+
+# score_stock이 직전 거래일 행에서 읽는 고정 컬럼 목록
+_PREV_ROW_COLUMNS = (
+    "close",
+    "rsi",
+    "atr_ratio",
+    "value_traded",
+    "ma5",
+    "ma20",
+    "ma60",
+)
 
 
 def score_stock(
@@ -132,7 +256,16 @@ def score_stock(
     if len(df) < conf.mom_long + 2:
         return None
 
-    prev = df.iloc[-2]  # 직전 거래일 기준
+    # 직전 거래일 기준 행을 평문 dict로 추출합니다.
+    # df.iloc[-2]는 pd.Series를 생성하고 이후 .get 호출마다 pandas 인덱서를
+    # 거치므로, 필요한 컬럼만 ndarray에서 직접 꺼내 오버헤드를 제거합니다.
+    row_idx = len(df) - 2
+    mom_keys = conf.mom_keys  # 설정 객체에 캐시된 ("mom5", "mom20", "mom60")
+    prev_cols = _PREV_ROW_COLUMNS + mom_keys
+    columns = df.columns
+    prev = {
+        col: float(df[col].values[row_idx]) for col in prev_cols if col in columns
+    }
 
     # --- 기본 데이터 추출 ---
     last_close = prev.get("close", 0.0)
@@ -148,42 +281,25 @@ def score_stock(
     if prev.get("value_traded", 0.0) < min_turnover:
         return None
 
-    # --- 전략 적용 ---
-    strategy_impl = get_strategy(strategy)
-
-    # 1. RSI 보너스 계산
-    rsi_bonus = strategy_impl.calculate_rsi_bonus(rsi)
-
-    # 2. MA 페널티 및 경고 확인
-    ma_penalty, warnings = strategy_impl.check_ma_penalty(last_close, prev)
-
-    gap_bonus = 0.0
-
-    # --- 점수 계산 ---
-    mom_weights = strategy_impl.mom_weights
-    vol_penalty_weight = strategy_impl.vol_penalty_weight
-    news_impact_factor = strategy_impl.news_impact_factor
-
-    # 1. 모멘텀 점수 (Z-Score 기반)
-    z5 = mom_z_scores.get(f"mom{conf.mom_short}", 0.0)
-    z20 = mom_z_scores.get(f"mom{conf.mom_med}", 0.0)
-    z60 = mom_z_scores.get(f"mom{conf.mom_long}", 0.0)
-    mom_core = mom_weights[0] * z5 + mom_weights[1] * z20 + mom_weights[2] * z60
-
-    # 2. 변동성 페널티 (ATR 반영)
-    # ATR 비율이 높으면(예: 3% 이상) 페널티 부여
-    atr_penalty = max(0, (atr_ratio - 0.03) * 10)
-
-    final_vol_penalty = (vol_penalty_weight * volatility_score) + (atr_penalty * 0.5)
-
-    # 3. 최종 산식
-    score = (
-        mom_core
-        - final_vol_penalty
-        + (news_impact_factor * float(news_score or 0.0))
-        - ma_penalty
-        + gap_bonus
-        + rsi_bonus
+    # --- 전략 적용 및 점수 계산 ---
+    # 전략 가중치가 지역 변수로 고정된 채점 클로저를 사용합니다.
+    # (가중치 조회/산식 조립이 전략당 한 번만 일어남)
+    scorer = get_strategy(strategy).compile_scorer()
+
+    z5 = mom_z_scores.get(mom_keys[0], 0.0)
+    z20 = mom_z_scores.get(mom_keys[1], 0.0)
+    z60 = mom_z_scores.get(mom_keys[2], 0.0)
+
+    score, mom_core, final_vol_penalty, rsi_bonus, ma_penalty, warnings = scorer(
+        z5,
+        z20,
+        z60,
+        rsi,
+        atr_ratio,
+        volatility_score,
+        float(news_score or 0.0),
+        last_close,
+        prev,
     )
 
     # 디버깅/설명용 Reason 생성
@@ -207,9 +323,9 @@ def score_stock(
         score=round(float(score), 2),
         reason=reason,
         momentum={
-            "m5": round(float(prev.get(f"mom{conf.mom_short}", 0)), 4),
-            "m20": round(float(prev.get(f"mom{conf.mom_med}", 0)), 4),
-            "m60": round(float(prev.get(f"mom{conf.mom_long}", 0)), 4),
+            "m5": round(float(prev.get(mom_keys[0], 0)), 4),
+            "m20": round(float(prev.get(mom_keys[1], 0)), 4),
+            "m60": round(float(prev.get(mom_keys[2], 0)), 4),
             "rsi": round(float(prev.get("rsi", 50.0)), 2),
         },
         news_sentiment_score=(
@@ -217,3 +333,139 @@ def score_stock(
         ),
         price=float(last_close),  # 종가 정보
     )
+
+
+# score_stock_batch에서 각 컬럼이 프레임에 없을 때 사용할 기본값.
+# ma 컬럼의 +inf는 score_stock의 prev_data.get("ma5", float("inf"))와
+# 동일한 의미(컬럼 부재 시 이탈 페널티 적용)를 유지하기 위함입니다.
+_PREV_ROW_DEFAULTS = {
+    "close": 0.0,
+    "rsi": 50.0,
+    "atr_ratio": 0.0,
+    "value_traded": 0.0,
+    "ma5": float("inf"),
+    "ma20": float("inf"),
+    "ma60": float("inf"),
+}
+
+
+def score_stock_batch(
+    codes: Sequence[str],
+    names: Sequence[str],
+    dfs: Sequence[pd.DataFrame],
+    mom_z_scores: Sequence[Mapping[str, float]],
+    news_scores: Sequence[Optional[float]],
+    volatility_scores: Sequence[float],
+    conf: FeatureConf,
+    market_regime: str = "NEUTRAL",
+    strategy: str = "default",
+) -> List[Optional[StockScore]]:
+    """코호트 전체를 한 번에 채점하는 `score_stock`의 배열 버전입니다.
+
+    종목별 Python 루프 대신 직전 거래일 행들을 배열로 쌓아
+    모멘텀 코어/변동성 페널티/RSI 보너스/MA 페널티를 NumPy 연산으로
+    일괄 계산합니다. Reason 문자열과 StockScore 생성은 필터를 통과한
+    생존 종목에 대해서만 수행합니다. 결과는 입력 순서를 유지하며,
+    각 원소는 `score_stock`과 동일한 값(또는 None)입니다.
+    """
+    n = len(codes)
+    if n == 0:
+        return []
+
+    strat = get_strategy(strategy)
+    w5, w20, w60 = strat.mom_weights
+    mom_keys = conf.mom_keys
+    min_len = conf.mom_long + 2
+
+    prev_cols = _PREV_ROW_COLUMNS + mom_keys
+    col_defaults = [_PREV_ROW_DEFAULTS.get(col, 0.0) for col in prev_cols]
+
+    # 1. 직전 거래일 행을 (종목 x 컬럼) 행렬로 수집
+    eligible = np.zeros(n, dtype=bool)
+    row_vals = np.empty((n, len(prev_cols)), dtype=np.float64)
+    for i, df in enumerate(dfs):
+        if len(df) < min_len:
+            continue
+        eligible[i] = True
+        row_idx = len(df) - 2
+        columns = df.columns
+        for j, col in enumerate(prev_cols):
+            row_vals[i, j] = (
+                float(df[col].values[row_idx])
+                if col in columns
+                else col_defaults[j]
+            )
+
+    col_idx = {col: j for j, col in enumerate(prev_cols)}
+    last_close = row_vals[:, col_idx["close"]]
+    rsi = row_vals[:, col_idx["rsi"]]
+    atr_ratio = row_vals[:, col_idx["atr_ratio"]]
+    value_traded = row_vals[:, col_idx["value_traded"]]
+
+    # 2. 거래대금 필터 (score_stock과 동일한 약세장 1.5배 기준)
+    min_turnover = (
+        conf.min_turnover_won * 1.5
+        if market_regime == "BEAR"
+        else conf.min_turnover_won
+    )
+    valid = eligible & (value_traded >= min_turnover)
+
+    # 3. 점수 산식 일괄 계산
+    z5 = np.array([z.get(mom_keys[0], 0.0) for z in mom_z_scores], dtype=np.float64)
+    z20 = np.array([z.get(mom_keys[1], 0.0) for z in mom_z_scores], dtype=np.float64)
+    z60 = np.array([z.get(mom_keys[2], 0.0) for z in mom_z_scores], dtype=np.float64)
+    news = np.array([float(s or 0.0) for s in news_scores], dtype=np.float64)
+    vol = np.asarray(volatility_scores, dtype=np.float64)
+
+    mom_core = w5 * z5 + w20 * z20 + w60 * z60
+    atr_penalty = np.maximum(0.0, (atr_ratio - 0.03) * 10)
+    final_vol_penalty = (strat.vol_penalty_weight * vol) + (atr_penalty * 0.5)
+    rsi_bonus = strat.calculate_rsi_bonus_batch(rsi)
+    ma_penalty, ma_warning = strat.check_ma_penalty_batch(
+        last_close,
+        row_vals[:, col_idx["ma5"]],
+        row_vals[:, col_idx["ma60"]],
+    )
+    scores = (
+        mom_core
+        - final_vol_penalty
+        + (strat.news_impact_factor * news)
+        - ma_penalty
+        + rsi_bonus
+    )
+
+    # 4. 생존 종목에 대해서만 Reason/StockScore 생성
+    results: List[Optional[StockScore]] = [None] * n
+    for i in np.flatnonzero(valid):
+        reason_parts = [
+            f"mom={mom_core[i]:.2f}",
+            f"vol_p={final_vol_penalty[i]:.2f}",
+            f"rsi={rsi[i]:.0f}",
+        ]
+        if rsi_bonus[i] > 0:
+            reason_parts.append("RSI보너스")
+        if ma_penalty[i] > 0:
+            reason_parts.append("MA이탈")
+
+        reason = ", ".join(reason_parts)
+        if ma_penalty[i] > 0 and ma_warning:
+            reason += f" [주의: {ma_warning}]"
+
+        news_score = news_scores[i]
+        results[i] = StockScore(
+            code=codes[i],
+            name=names[i],
+            score=round(float(scores[i]), 2),
+            reason=reason,
+            momentum={
+                "m5": round(float(row_vals[i, col_idx[mom_keys[0]]]), 4),
+                "m20": round(float(row_vals[i, col_idx[mom_keys[1]]]), 4),
+                "m60": round(float(row_vals[i, col_idx[mom_keys[2]]]), 4),
+                "rsi": round(float(rsi[i]), 2),
+            },
+            news_sentiment_score=(
+                round(float(news_score), 3) if news_score is not None else None
+            ),
+            price=float(last_close[i]),
+        )
+    return results
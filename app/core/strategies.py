@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import Callable, List, Mapping, Tuple
 
-import pandas as pd
+import numpy as np
 
 from ..config import (
     RSI_OVERBOUGHT,
@@ -17,20 +17,81 @@ class BaseStrategy(ABC):
     각 전략은 RSI 보너스, MA 페널티, 경고 메시지 생성 로직을 구현해야 합니다.
     """
 
+    # 인스턴스 __dict__를 제거하여 속성 접근을 C 레벨 슬롯 조회로 바꿉니다.
+    # (score_stock 핫패스에서 mom_weights 등을 반복해서 읽음)
+    __slots__ = (
+        "config",
+        "mom_weights",
+        "vol_penalty_weight",
+        "news_impact_factor",
+        "_compiled_scorer",
+    )
+
     def __init__(self, strategy_name: str = "default"):
         self.config = STRATEGY_CONFIG.get(strategy_name, STRATEGY_CONFIG["default"])
 
-    @property
-    def mom_weights(self) -> Tuple[float, float, float]:
-        return self.config["mom_weights"]
+        # 핫패스(score_stock)에서 매번 dict 조회를 하지 않도록
+        # 설정값을 인스턴스 속성으로 미리 꺼내둡니다.
+        self.mom_weights: Tuple[float, float, float] = self.config["mom_weights"]
+        self.vol_penalty_weight: float = self.config["vol_penalty_weight"]
+        self.news_impact_factor: float = self.config["news_impact_factor"]
+        self._compiled_scorer = None
 
-    @property
-    def vol_penalty_weight(self) -> float:
-        return self.config["vol_penalty_weight"]
+    def compile_scorer(self) -> Callable:
+        """전략 상수를 지역 변수로 고정한 채점 클로저를 반환합니다.
 
-    @property
-    def news_impact_factor(self) -> float:
-        return self.config["news_impact_factor"]
+        score_stock이 종목마다 가중치 속성 조회와 산식 조립을 반복하지
+        않도록, 전략별 가중치를 부분 평가(partial evaluation)해 둔
+        함수를 한 번만 만들어 캐시합니다.
+
+        반환 함수 시그니처:
+            (z5, z20, z60, rsi, atr_ratio, vol_score, news_score,
+             last_close, prev_data)
+            -> (score, mom_core, final_vol_penalty, rsi_bonus,
+                ma_penalty, warnings)
+        """
+        if self._compiled_scorer is not None:
+            return self._compiled_scorer
+
+        w5, w20, w60 = self.mom_weights
+        vol_penalty_weight = self.vol_penalty_weight
+        news_impact_factor = self.news_impact_factor
+        calculate_rsi_bonus = self.calculate_rsi_bonus
+        check_ma_penalty = self.check_ma_penalty
+
+        def scorer(
+            z5: float,
+            z20: float,
+            z60: float,
+            rsi: float,
+            atr_ratio: float,
+            vol_score: float,
+            news_score: float,
+            last_close: float,
+            prev_data: Mapping[str, float],
+        ) -> Tuple[float, float, float, float, float, List[str]]:
+            mom_core = w5 * z5 + w20 * z20 + w60 * z60
+
+            # ATR 비율이 높으면(예: 3% 이상) 페널티 부여
+            atr_penalty = max(0.0, (atr_ratio - 0.03) * 10)
+            final_vol_penalty = (vol_penalty_weight * vol_score) + (
+                atr_penalty * 0.5
+            )
+
+            rsi_bonus = calculate_rsi_bonus(rsi)
+            ma_penalty, warnings = check_ma_penalty(last_close, prev_data)
+
+            score = (
+                mom_core
+                - final_vol_penalty
+                + (news_impact_factor * news_score)
+                - ma_penalty
+                + rsi_bonus
+            )
+            return score, mom_core, final_vol_penalty, rsi_bonus, ma_penalty, warnings
+
+        self._compiled_scorer = scorer
+        return scorer
 
     @property
     @abstractmethod
@@ -45,11 +106,27 @@ class BaseStrategy(ABC):
 
     @abstractmethod
     def check_ma_penalty(
-        self, last_close: float, prev_data: pd.Series
+        self, last_close: float, prev_data: Mapping[str, float]
     ) -> Tuple[float, List[str]]:
         """이동평균선 이탈 여부를 확인하여 페널티 점수와 경고 메시지를 반환합니다."""
         pass
 
+    @abstractmethod
+    def calculate_rsi_bonus_batch(self, rsi: np.ndarray) -> np.ndarray:
+        """calculate_rsi_bonus의 배열 버전: 코호트 전체를 한 번에 계산합니다."""
+        pass
+
+    @abstractmethod
+    def check_ma_penalty_batch(
+        self, last_close: np.ndarray, ma5: np.ndarray, ma60: np.ndarray
+    ) -> Tuple[np.ndarray, str]:
+        """check_ma_penalty의 배열 버전입니다.
+
+        (페널티 배열, 페널티 발생 시 붙일 경고 문구)를 반환합니다.
+        전략마다 경고 문구가 하나뿐이라 문자열 상수로 충분합니다.
+        """
+        pass
+
 
 class DayTraderStrategy(BaseStrategy):
     """
@@ -58,6 +135,8 @@ class DayTraderStrategy(BaseStrategy):
     - 5일 이동평균선 이탈 시 페널티를 부여합니다.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("day_trader")
 
@@ -76,7 +155,7 @@ class DayTraderStrategy(BaseStrategy):
         return 0.0
 
     def check_ma_penalty(
-        self, last_close: float, prev_data: pd.Series
+        self, last_close: float, prev_data: Mapping[str, float]
     ) -> Tuple[float, List[str]]:
         warnings = []
         penalty = 0.0
@@ -85,6 +164,16 @@ class DayTraderStrategy(BaseStrategy):
             warnings.append("5일선 이탈")
         return penalty, warnings
 
+    def calculate_rsi_bonus_batch(self, rsi: np.ndarray) -> np.ndarray:
+        return np.where(
+            rsi < RSI_OVERSOLD, 2.0, np.where(rsi > RSI_OVERBOUGHT, -1.0, 0.0)
+        )
+
+    def check_ma_penalty_batch(
+        self, last_close: np.ndarray, ma5: np.ndarray, ma60: np.ndarray
+    ) -> Tuple[np.ndarray, str]:
+        return np.where(last_close < ma5, 0.5, 0.0), "5일선 이탈"
+
 
 class LongTermStrategy(BaseStrategy):
     """
@@ -93,6 +182,8 @@ class LongTermStrategy(BaseStrategy):
     - 60일 이동평균선(장기 추세) 훼손 시 큰 페널티를 부여합니다.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("long_term")
 
@@ -109,7 +200,7 @@ class LongTermStrategy(BaseStrategy):
         return 0.0
 
     def check_ma_penalty(
-        self, last_close: float, prev_data: pd.Series
+        self, last_close: float, prev_data: Mapping[str, float]
     ) -> Tuple[float, List[str]]:
         warnings = []
         penalty = 0.0
@@ -118,6 +209,14 @@ class LongTermStrategy(BaseStrategy):
             warnings.append("장기 추세 훼손")
         return penalty, warnings
 
+    def calculate_rsi_bonus_batch(self, rsi: np.ndarray) -> np.ndarray:
+        return np.where((rsi < RSI_OVERSOLD) | (rsi > RSI_OVERBOUGHT), -0.5, 0.0)
+
+    def check_ma_penalty_batch(
+        self, last_close: np.ndarray, ma5: np.ndarray, ma60: np.ndarray
+    ) -> Tuple[np.ndarray, str]:
+        return np.where(last_close < ma60, 1.0, 0.0), "장기 추세 훼손"
+
 
 class DefaultStrategy(BaseStrategy):
     """
@@ -126,6 +225,8 @@ class DefaultStrategy(BaseStrategy):
     - 별도의 이동평균선 페널티는 없습니다.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("default")
 
@@ -144,15 +245,30 @@ class DefaultStrategy(BaseStrategy):
         return 0.0
 
     def check_ma_penalty(
-        self, last_close: float, prev_data: pd.Series
+        self, last_close: float, prev_data: Mapping[str, float]
     ) -> Tuple[float, List[str]]:
         return 0.0, []
 
+    def calculate_rsi_bonus_batch(self, rsi: np.ndarray) -> np.ndarray:
+        return np.where(
+            rsi < RSI_OVERSOLD, 0.5, np.where(rsi > RSI_STRONG_OVERBOUGHT, -0.5, 0.0)
+        )
+
+    def check_ma_penalty_batch(
+        self, last_close: np.ndarray, ma5: np.ndarray, ma60: np.ndarray
+    ) -> Tuple[np.ndarray, str]:
+        return np.zeros_like(last_close), ""
+
+
+# 전략 객체는 상태가 없으므로 모듈 로드 시 한 번만 생성하여 재사용합니다.
+# (score_stock이 종목마다 호출되므로 매번 인스턴스를 만들면 순수 낭비)
+_STRATEGY_INSTANCES = {
+    "day_trader": DayTraderStrategy(),
+    "long_term": LongTermStrategy(),
+    "default": DefaultStrategy(),
+}
+
 
 def get_strategy(strategy_name: str) -> BaseStrategy:
     """전략 이름에 해당하는 전략 인스턴스를 반환하는 팩토리 함수입니다."""
-    strategies = {
-        "day_trader": DayTraderStrategy,
-        "long_term": LongTermStrategy,
-    }
-    return strategies.get(strategy_name, DefaultStrategy)()
+    return _STRATEGY_INSTANCES.get(strategy_name, _STRATEGY_INSTANCES["default"])
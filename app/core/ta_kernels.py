@@ -0,0 +1,185 @@
+# app/core/ta_kernels.py
+
+"""기술적 지표 계산용 저수준 커널 모음입니다.
+
+pandas의 ewm/rolling 경로는 종목당 수많은 중간 Series를 할당하므로,
+수천 종목을 처리하는 핫패스에서는 NumPy 배열 위에서 한 번에 도는
+Numba 커널을 사용합니다. Numba가 설치되지 않은 환경에서는 동일한
+함수를 순수 파이썬으로 실행하는 폴백을 제공합니다.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:  # pragma: no cover - numba 미설치 환경용 폴백
+    _HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """numba가 없을 때 커널을 일반 함수로 실행하는 대체 데코레이터입니다."""
+
+        def decorator(func):
+            return func
+
+        # @njit 처럼 인자 없이 사용된 경우
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return decorator
+
+
+def sma_kernel(arr: np.ndarray, window: int) -> np.ndarray:
+    """누적합 기반 단순이동평균(SMA)입니다.
+
+    rolling(window).mean()이 창마다 합을 다시 구하는 O(n*w) 경로 대신,
+    누적합 차분으로 O(n)에 계산합니다. 워밍업 구간(index < window-1)은
+    rolling과 동일하게 NaN을 유지합니다. 출력은 입력 dtype을 따르며,
+    누적합 자체는 정밀도 손실을 막기 위해 항상 float64로 수행합니다.
+    """
+    n = arr.shape[0]
+    out = np.full(n, np.nan, dtype=arr.dtype)
+    if n < window:
+        return out
+    cs = np.cumsum(arr, dtype=np.float64)
+    out[window - 1] = cs[window - 1] / window
+    out[window:] = (cs[window:] - cs[:-window]) / window
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def rsi_kernel(closes: np.ndarray, period: int) -> np.ndarray:
+    """Wilder's Smoothing 기반 RSI를 단일 패스로 계산합니다.
+
+    index < period 구간은 워밍업으로 NaN을 유지하며,
+    avg_gain/avg_loss는 period 시점의 단순평균(SMA)으로 시드합니다.
+    출력 dtype은 입력을 따릅니다(float32 입력이면 float32 출력).
+    """
+    n = closes.shape[0]
+    out = np.full(n, np.nan, dtype=closes.dtype)
+    if n <= period:
+        return out
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        delta = closes[i] - closes[i - 1]
+        avg_gain += max(delta, 0.0)
+        avg_loss += max(-delta, 0.0)
+    avg_gain /= period
+    avg_loss /= period
+
+    if avg_loss == 0.0:
+        out[period] = 100.0
+    else:
+        out[period] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    for i in range(period + 1, n):
+        delta = closes[i] - closes[i - 1]
+        avg_gain = (avg_gain * (period - 1) + max(delta, 0.0)) / period
+        avg_loss = (avg_loss * (period - 1) + max(-delta, 0.0)) / period
+        if avg_loss == 0.0:
+            out[i] = 100.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+
+def _rsi_kernel_numpy(closes: np.ndarray, period: int) -> np.ndarray:
+    """numba 미설치 환경용 RSI 폴백입니다.
+
+    gain/loss 분리를 Series.where 같은 분기 대신 np.maximum ufunc로
+    일괄 계산하고, Wilder 스무딩 재귀만 파이썬 루프로 수행합니다.
+    """
+    n = closes.shape[0]
+    out = np.full(n, np.nan, dtype=closes.dtype)
+    if n <= period:
+        return out
+
+    delta = np.empty_like(closes)
+    delta[0] = 0.0
+    delta[1:] = closes[1:] - closes[:-1]
+    gains = np.maximum(delta, 0.0)
+    losses = np.maximum(-delta, 0.0)
+
+    avg_gain = gains[1 : period + 1].mean()
+    avg_loss = losses[1 : period + 1].mean()
+    if avg_loss == 0.0:
+        out[period] = 100.0
+    else:
+        out[period] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    for i in range(period + 1, n):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+        if avg_loss == 0.0:
+            out[i] = 100.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def atr_kernel(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int
+) -> np.ndarray:
+    """True Range 계산과 Wilder's Smoothing을 한 루프에 융합한 ATR 커널입니다.
+
+    tr1/tr2/tr3 Series 3개 + concat + 행 단위 max + ewm 으로 배열을
+    여러 번 순회하는 대신, OHLC 원시 배열 위를 한 번만 스캔합니다.
+    출력 dtype은 입력을 따릅니다(float32 입력이면 float32 출력).
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan, dtype=close.dtype)
+    if n <= period:
+        return out
+
+    # SMA 시드: index 1..period 구간의 TR 평균
+    atr = 0.0
+    for i in range(1, period + 1):
+        tr = max(high[i] - low[i], abs(high[i] - close[i - 1]))
+        tr = max(tr, abs(low[i] - close[i - 1]))
+        atr += tr
+    atr /= period
+    out[period] = atr
+
+    for i in range(period + 1, n):
+        tr = max(high[i] - low[i], abs(high[i] - close[i - 1]))
+        tr = max(tr, abs(low[i] - close[i - 1]))
+        atr = (atr * (period - 1) + tr) / period
+        out[i] = atr
+    return out
+
+
+def _atr_kernel_numpy(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int
+) -> np.ndarray:
+    """numba 미설치 환경용 ATR 폴백입니다.
+
+    True Range는 DataFrame concat + 행 단위 max 대신 np.maximum.reduce
+    (SIMD 벡터화 ufunc)로 일괄 계산하고, Wilder 스무딩 재귀만
+    파이썬 루프로 수행합니다.
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan, dtype=close.dtype)
+    if n <= period:
+        return out
+
+    prev_close = np.empty_like(close)
+    prev_close[0] = np.nan
+    prev_close[1:] = close[:-1]
+    tr = np.maximum.reduce(
+        [high - low, np.abs(high - prev_close), np.abs(low - prev_close)]
+    )
+
+    atr = tr[1 : period + 1].mean()
+    out[period] = atr
+    for i in range(period + 1, n):
+        atr = (atr * (period - 1) + tr[i]) / period
+        out[i] = atr
+    return out
+
+
+if not _HAS_NUMBA:  # pragma: no cover - numba 미설치 환경용 폴백
+    rsi_kernel = _rsi_kernel_numpy
+    atr_kernel = _atr_kernel_numpy
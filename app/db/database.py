@@ -9,7 +9,14 @@ if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL이 환경변수에 설정되지 않았습니다.")
 
 # 데이터베이스 엔진 생성
-engine = create_engine(DATABASE_URL)
+# 비동기 워커가 기본 풀(5개)을 쉽게 포화시키므로 워크로드에 맞춰 풀을 튜닝하고,
+# 유휴 커넥션이 끊긴 채 재사용되지 않도록 pre_ping/recycle을 설정합니다.
+# (SQLite는 QueuePool 인자를 받지 않으므로 테스트 환경에서는 기본 풀 사용)
+_engine_kwargs = {"pool_pre_ping": True, "future": True}
+if not DATABASE_URL.startswith("sqlite"):
+    _engine_kwargs.update(pool_size=20, max_overflow=10, pool_recycle=1800)
+
+engine = create_engine(DATABASE_URL, **_engine_kwargs)
 
 # 세션 생성기
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -1,7 +1,10 @@
 # app/db/db_models.py
 
-from sqlalchemy import JSON, Column, Date, DateTime, Float, ForeignKey, Integer, String
-from sqlalchemy.orm import relationship
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import JSON, Date, DateTime, ForeignKey, Index, insert
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from .database import Base
@@ -10,29 +13,47 @@ from .database import Base
 class RecommendationRun(Base):
     __tablename__ = "recommendation_runs"
 
-    id = Column(Integer, primary_key=True, index=True)
-    as_of = Column(Date, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    as_of: Mapped[date] = mapped_column(Date, nullable=False)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
 
     # RecommendedStock
-    stocks = relationship("RecommendedStock", back_populates="run")
+    stocks: Mapped[List["RecommendedStock"]] = relationship(back_populates="run")
 
 
 class RecommendedStock(Base):
     __tablename__ = "recommended_stocks"
+    # 조회가 주로 (run_id, code) 기준이므로 복합 인덱스를 둡니다.
+    __table_args__ = (Index("ix_recommended_stocks_run_id_code", "run_id", "code"),)
 
-    id = Column(Integer, primary_key=True, index=True)
-    run_id = Column(Integer, ForeignKey("recommendation_runs.id"), nullable=False)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    run_id: Mapped[int] = mapped_column(
+        ForeignKey("recommendation_runs.id"), nullable=False
+    )
 
-    code = Column(String, nullable=False, index=True)
-    name = Column(String, nullable=False)
-    score = Column(Float, nullable=False)
-    weight = Column(Float, nullable=False)
-    reason = Column(String)
+    code: Mapped[str] = mapped_column(nullable=False, index=True)
+    name: Mapped[str] = mapped_column(nullable=False)
+    score: Mapped[float] = mapped_column(nullable=False)
+    weight: Mapped[float] = mapped_column(nullable=False)
+    reason: Mapped[Optional[str]]
 
     # 복잡한 데이터를 JSON으로 저장
-    momentum = Column(JSON)
-    news_sentiment = Column(JSON)
+    momentum: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON)
+    news_sentiment: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON)
 
     # RecommendationRun
-    run = relationship("RecommendationRun", back_populates="stocks")
+    run: Mapped["RecommendationRun"] = relationship(back_populates="stocks")
+
+    @classmethod
+    def bulk_insert(cls, session: Session, rows: List[Dict[str, Any]]) -> None:
+        """추천 종목 N건을 단일 executemany INSERT로 저장합니다.
+
+        행마다 session.add를 호출하면 identity map 관리 비용과 함께
+        N번의 INSERT 왕복이 발생하므로, 쓰기 전용인 추천 결과 저장
+        경로에서는 Core insert로 일괄 처리합니다.
+        """
+        if not rows:
+            return
+        session.execute(insert(cls), rows)
@@ -1,6 +1,7 @@
 # frontend/main.py
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote
 
 import pandas as pd
@@ -13,6 +14,19 @@ import streamlit as st
 # Docker Compose 실행 시: http://api:8000
 API_URL = os.getenv("API_URL", "http://localhost:8000")
 
+
+@st.cache_resource
+def get_session() -> requests.Session:
+    """API 호출용 커넥션을 재사용하는 requests.Session을 반환합니다.
+
+    버튼 클릭마다 requests.get으로 새 TCP/TLS 연결을 맺지 않도록
+    keep-alive 세션을 앱 수명 동안 공유합니다.
+    """
+    return requests.Session()
+
+
+session = get_session()
+
 st.set_page_config(page_title="Friendantial", page_icon="🐵", layout="wide")
 
 st.title("🐵 Friendantial: 아침을 여는 AI 투자 친구")
@@ -43,7 +57,7 @@ with tab1:
         with st.spinner("시장 데이터를 분석하고 AI 리포트를 작성 중입니다..."):
             try:
                 # 1. 요약 리포트 요청
-                response = requests.get(
+                response = session.get(
                     f"{API_URL}/reporting/summary?strategy={strategy}&persona={persona}",
                 )
                 response.raise_for_status()
@@ -55,7 +69,7 @@ with tab1:
                 st.markdown(report_content)
 
                 # 2. 추천 종목 목록 요청
-                reco_response = requests.get(
+                reco_response = session.get(
                     f"{API_URL}/basic_analysis/recommendations?strategy={strategy}",
                 )
                 reco_response.raise_for_status()
@@ -89,7 +103,7 @@ with tab2:
                     report_url = (
                         f"{API_URL}/reporting/stock/{encoded_input}?persona={persona}"
                     )
-                    response = requests.get(report_url)
+                    response = session.get(report_url)
                     response.raise_for_status()
                     report_data = response.json()
 
@@ -107,9 +121,12 @@ with tab2:
                             "news": f"{API_URL}/basic_analysis/news-sentiment/{encoded_input}",
                         }
 
-                        responses = {
-                            name: requests.get(url) for name, url in urls.items()
-                        }
+                        # 상세 데이터 3건은 스레드 풀로 병렬 호출하여
+                        # 가장 느린 응답 하나만큼만 기다립니다.
+                        with ThreadPoolExecutor(max_workers=3) as executor:
+                            responses = dict(
+                                zip(urls, executor.map(session.get, urls.values()))
+                            )
 
                         # 각 응답을 처리
                         ohlcv_data = (
@@ -239,7 +256,7 @@ with tab3:
             with st.spinner("최신 뉴스를 검색하고 답변을 생성 중입니다..."):
                 try:
                     # RAG API 호출
-                    response = requests.get(
+                    response = session.get(
                         f"{API_URL}/opinion/{stock_code}",
                         params={
                             "question": question,
@@ -271,7 +288,7 @@ with tab4:
     if st.button("이력 조회"):
         with st.spinner("과거 추천 기록을 불러오는 중입니다..."):
             try:
-                response = requests.get(f"{API_URL}/history/recommendations?limit=50")
+                response = session.get(f"{API_URL}/history/recommendations?limit=50")
                 response.raise_for_status()
                 history_data = response.json()
 
@@ -312,7 +329,7 @@ with tab5:
     if st.button("백테스트 실행"):
         with st.spinner(f"{target_date} 기준으로 백테스트를 실행합니다..."):
             try:
-                response = requests.get(
+                response = session.get(
                     f"{API_URL}/backtest/simulate",
                     params={
                         "target_date": target_date.strftime("%Y-%m-%d"),
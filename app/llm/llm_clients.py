@@ -1,9 +1,10 @@
 # app/llm/llm_clients.py
 
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import AsyncIterator, Dict, List
 
 import google.generativeai as genai
+import httpx
 import openai
 
 
@@ -22,6 +23,16 @@ class AbstractLLMClient(ABC):
         """
         pass
 
+    async def stream_chat_completion(
+        self, messages: List[Dict[str, str]], model: str
+    ) -> AsyncIterator[str]:
+        """
+        응답을 텍스트 조각 단위로 스트리밍합니다.
+        기본 구현은 전체 응답을 한 조각으로 내보내므로,
+        스트리밍을 지원하는 구현체는 이 메서드를 재정의합니다.
+        """
+        yield await self.generate_chat_completion(messages, model)
+
     async def close(self):
         pass
 
@@ -32,7 +43,14 @@ class OpenAIChatClient(AbstractLLMClient):
     """
 
     def __init__(self, api_key: str):
-        self._client = openai.AsyncClient(api_key=api_key)
+        # 요약/종목 리포트가 병렬로 터질 때 호출마다 TCP+TLS 핸드셰이크를
+        # 반복하지 않도록, HTTP/2 멀티플렉싱과 keepalive 풀을 켠 전송을
+        # SDK에 직접 넘깁니다.
+        self._http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+        )
+        self._client = openai.AsyncClient(api_key=api_key, http_client=self._http_client)
 
     async def generate_chat_completion(
         self, messages: List[Dict[str, str]], model: str
@@ -43,8 +61,22 @@ class OpenAIChatClient(AbstractLLMClient):
         )
         return chat_completion.choices[0].message.content
 
+    async def stream_chat_completion(
+        self, messages: List[Dict[str, str]], model: str
+    ) -> AsyncIterator[str]:
+        stream = await self._client.chat.completions.create(
+            messages=messages,
+            model=model,
+            stream=True,
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
     async def close(self):
         await self._client.close()
+        if not self._http_client.is_closed:
+            await self._http_client.aclose()
 
 
 class GeminiChatClient(AbstractLLMClient):
@@ -54,20 +86,56 @@ class GeminiChatClient(AbstractLLMClient):
 
     def __init__(self, api_key: str):
         genai.configure(api_key=api_key)
-        self._model = None
+        # (model, system_instruction) 조합별로 GenerativeModel을 캐시합니다.
+        # 모델을 번갈아 호출해도 SDK 객체를 매번 다시 만들지 않습니다.
+        self._models: Dict[tuple, genai.GenerativeModel] = {}
+
+    def _get_model(self, model: str, system_instruction: str) -> genai.GenerativeModel:
+        key = (model, system_instruction)
+        cached = self._models.get(key)
+        if cached is None:
+            cached = self._models.setdefault(
+                key,
+                genai.GenerativeModel(
+                    model, system_instruction=system_instruction or None
+                ),
+            )
+        return cached
 
     async def generate_chat_completion(
         self, messages: List[Dict[str, str]], model: str
     ) -> str:
-        # Gemini: model 객체 먼저 생성
-        if self._model is None or self._model.model_name != model:
-            self._model = genai.GenerativeModel(model)
-
-        # OpenAI의 'system' 역할을 Gemini 형식에 맞게 변환
-        # 간단히 첫 메시지를 시스템 프롬프트로 간주
-        prompt = "\n".join([f"{m['role']}: {m['content']}" for m in messages])
-        response = await self._model.generate_content_async(prompt)
+        # OpenAI의 'system' 역할은 Gemini의 system_instruction으로 전달하고,
+        # 나머지 메시지만 프롬프트로 합칩니다.
+        system_instruction = "\n".join(
+            m["content"] for m in messages if m["role"] == "system"
+        )
+        model_obj = self._get_model(model, system_instruction)
+
+        prompt = "\n".join(
+            f"{m['role']}: {m['content']}"
+            for m in messages
+            if m["role"] != "system"
+        )
+        response = await model_obj.generate_content_async(prompt)
         return response.text
 
+    async def stream_chat_completion(
+        self, messages: List[Dict[str, str]], model: str
+    ) -> AsyncIterator[str]:
+        system_instruction = "\n".join(
+            m["content"] for m in messages if m["role"] == "system"
+        )
+        model_obj = self._get_model(model, system_instruction)
+        prompt = "\n".join(
+            f"{m['role']}: {m['content']}"
+            for m in messages
+            if m["role"] != "system"
+        )
+        response = await model_obj.generate_content_async(prompt, stream=True)
+        async for chunk in response:
+            if chunk.text:
+                yield chunk.text
+
     async def close(self):
         pass
@@ -1,13 +1,38 @@
 # app/llm/llm_service.py
 
 import os
+from datetime import timedelta
+from functools import lru_cache
+from typing import AsyncIterator
 
 import redis.asyncio as redis
 from fastapi import HTTPException
 from jinja2 import Environment
 
 from app.llm.llm_clients import AbstractLLMClient
-from app.utils.caching import cached_llm_generation
+from app.utils.caching import build_llm_cache_key, cached_llm_generation
+
+
+@lru_cache(maxsize=32)
+def _render_system_prompt(persona_name: str, jinja_env_id: int) -> str:
+    """페르소나별 시스템 프롬프트를 렌더링하고 결과 문자열을 메모이즈합니다.
+
+    시스템 프롬프트는 컨텍스트 없이 렌더링되어 persona_name에 대해
+    결정적이므로, 요청마다 템플릿 조회/렌더링을 반복할 필요가 없습니다.
+    lru_cache는 해시 가능한 키만 받으므로 Environment 대신 id를 키로
+    사용합니다. (환경이 교체되면 키가 달라져 자연히 재렌더링됨)
+    """
+    jinja_env = _JINJA_ENVS[jinja_env_id]
+    template = jinja_env.get_template(f"system/{persona_name}.jinja2")
+    return template.render()
+
+
+# id -> Environment 역참조 테이블 (lifespan당 1개 수준이라 크기 걱정 없음)
+_JINJA_ENVS: dict = {}
+
+# 모델명은 프로세스 수명 동안 변하지 않으므로 호출마다 os.getenv를
+# 거치지 않고 모듈 로드 시 한 번만 읽어 둡니다.
+_MODEL_NAME = os.getenv("LLM_MODEL_NAME", "gpt-4-turbo")
 
 
 @cached_llm_generation(prefix="llm-prompt", ttl_days=1)
@@ -28,20 +53,70 @@ async def generate_text_with_persona(
 
     try:
         # system 폴더 아래의 {persona_name}.jinja2 템플릿을 사용
-        template = jinja_env.get_template(f"system/{persona_name}.jinja2")
-        system_prompt = template.render()
+        # (렌더링 결과는 페르소나별로 결정적이므로 메모이즈)
+        _JINJA_ENVS[id(jinja_env)] = jinja_env
+        system_prompt = _render_system_prompt(persona_name, id(jinja_env))
     except Exception:
         raise HTTPException(
             status_code=400, detail=f"에이전트에게 없는 성격입니다.: {persona_name}"
         )
 
-    model_name = os.getenv("LLM_MODEL_NAME", "gpt-4-turbo")
 
     generated_text = await llm_client.generate_chat_completion(
         messages=[
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ],
-        model=model_name,
+        model=_MODEL_NAME,
     )
     return generated_text
+
+
+async def stream_text_with_persona(
+    *,
+    persona_name: str,
+    user_prompt: str,
+    llm_client: AbstractLLMClient,
+    redis_conn: redis.Redis,
+    jinja_env: Environment,
+) -> AsyncIterator[str]:
+    """generate_text_with_persona의 스트리밍 버전입니다.
+
+    캐시에 있으면 전체 텍스트를 한 조각으로 내보내고(스트리밍 이점이
+    없으므로), 미스면 LLM 조각을 그대로 중계한 뒤 완성본을 동일한
+    캐시 키에 적재해 이후의 비스트리밍 호출도 히트하게 합니다.
+    """
+    if not llm_client:
+        raise HTTPException(
+            status_code=503, detail="LLM 클라이언트가 초기화되지 않았습니다."
+        )
+
+    cache_key = build_llm_cache_key("llm-prompt", persona_name, user_prompt)
+    cached_result = await redis_conn.get(cache_key)
+    if cached_result:
+        if isinstance(cached_result, bytes):
+            cached_result = cached_result.decode("utf-8")
+        yield cached_result
+        return
+
+    try:
+        _JINJA_ENVS[id(jinja_env)] = jinja_env
+        system_prompt = _render_system_prompt(persona_name, id(jinja_env))
+    except Exception:
+        raise HTTPException(
+            status_code=400, detail=f"에이전트에게 없는 성격입니다.: {persona_name}"
+        )
+
+
+    chunks = []
+    async for chunk in llm_client.stream_chat_completion(
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ],
+        model=_MODEL_NAME,
+    ):
+        chunks.append(chunk)
+        yield chunk
+
+    await redis_conn.set(cache_key, "".join(chunks), ex=timedelta(days=1))
@@ -1,7 +1,11 @@
 # app/llm/rag.py
 
+import hashlib
 import logging
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import xxhash
 
 
 class SimpleRAG:
@@ -9,6 +13,12 @@ class SimpleRAG:
         # 처음에는 아무것도 로드하지 않음
         self.client: Optional[Any] = None
         self.ef: Optional[Any] = None
+        # 핫패스용 인메모리 저장소: {종목코드: (제목 다이제스트, 제목들,
+        # int8로 양자화된 제목 임베딩 행렬)}. 뉴스 집합이 그대로면 제목
+        # 임베딩을 재사용하고 질문만 인코딩합니다. 정규화된 임베딩은
+        # [-1, 1] 범위이므로 127 스케일의 대칭 양자화로 float32 대비
+        # 메모리를 1/4로 줄이며, 코사인 순위 변화는 무시할 수준입니다.
+        self._title_cache: Dict[str, Tuple[str, List[str], np.ndarray]] = {}
 
     def _initialize(self):
         """처음 사용할 때 모델과 DB를 로드합니다 (Lazy Loading)."""
@@ -16,37 +26,107 @@ class SimpleRAG:
             logging.info("RAG 엔진(ChromaDB & Embedding) 초기화 중... (Lazy Load)")
 
             import chromadb
+            import torch
             from chromadb.utils import embedding_functions
 
             self.client = chromadb.Client()
+            # GPU가 있으면 인코더를 CUDA에 올려 문서 일괄 임베딩 처리량을
+            # 높이고, 없으면 기존 CPU 경로를 그대로 사용합니다.
+            device = "cuda" if torch.cuda.is_available() else "cpu"
             self.ef = embedding_functions.SentenceTransformerEmbeddingFunction(
-                model_name="jhgan/ko-sroberta-multitask"
+                model_name="jhgan/ko-sroberta-multitask", device=device
             )
-            logging.info("RAG 엔진 초기화 완료!")
+            logging.info(f"RAG 엔진 초기화 완료! (device={device})")
 
     def create_collection(self, stock_code: str, documents: List[str]):
-        """특정 종목을 위한 컬렉션을 생성하고 문서를 저장합니다."""
+        """특정 종목을 위한 컬렉션을 확보하고 새 문서만 증분 적재합니다.
+
+        삭제 후 재생성하면 호출마다 전체 문서를 다시 임베딩하게 되므로,
+        문서 내용 해시를 ID로 사용해 이미 적재된 문서는 인코더를 태우지
+        않고 건너뜁니다. (전체 재색인 O(total) → 증분 O(changed))
+        """
         # ChromaDB 컬렉션 이름 규칙 준수 (점 . 을 언더바 _ 로 변경)
         # 예: "######.KS" -> "stock_######_KS"
         self._initialize()
         safe_name = f"stock_{stock_code.replace('.', '_')}"
 
-        # 기존 컬렉션 삭제 시 에러 방지 (모든 예외 처리)
-        try:
-            self.client.delete_collection(name=safe_name)
-        except Exception:
-            pass
-
-        collection = self.client.create_collection(
+        collection = self.client.get_or_create_collection(
             name=safe_name, embedding_function=self.ef
         )
 
-        # 문서에 ID 부여하여 저장
         if documents:
-            ids = [f"id_{i}" for i in range(len(documents))]
-            collection.add(documents=documents, ids=ids)
+            ids = [hashlib.sha1(d.encode()).hexdigest() for d in documents]
+            try:
+                existing_ids = set(collection.get(ids=ids)["ids"])
+            except Exception as e:
+                logging.warning(f"RAG 기존 문서 조회 실패 ({safe_name}): {e}")
+                existing_ids = set()
+
+            # 같은 호출 안의 중복 문서도 한 번만 적재
+            new_docs: List[str] = []
+            new_ids: List[str] = []
+            for doc, doc_id in zip(documents, ids):
+                if doc_id not in existing_ids:
+                    existing_ids.add(doc_id)
+                    new_docs.append(doc)
+                    new_ids.append(doc_id)
+            if new_docs:
+                collection.upsert(documents=new_docs, ids=new_ids)
         return collection
 
+    def ingest_and_query(
+        self,
+        stock_code: str,
+        documents: List[str],
+        question: str,
+        n_results: int = 5,
+    ) -> List[str]:
+        """문서 적재와 질의를 한 번의 인코더 호출로 처리하는 핫패스입니다.
+
+        종목당 문서가 ~15개 수준이라 HNSW 인덱스를 거칠 이유가 없으므로,
+        제목들과 질문을 하나의 배치로 임베딩한 뒤 정규화된 행렬 내적으로
+        코사인 top-k를 직접 계산합니다. 같은 뉴스 집합이 다시 들어오면
+        제목 임베딩을 재사용하고 질문만 인코딩합니다.
+        """
+        if not documents:
+            return []
+        self._initialize()
+
+        digest = xxhash.xxh3_64(
+            b"\n".join(t.encode() for t in sorted(documents))
+        ).hexdigest()
+
+        cached = self._title_cache.get(stock_code)
+        if cached is not None and cached[0] == digest:
+            _, titles, doc_q = cached
+            q_emb = self._encode([question])[0]
+        else:
+            # 제목 + 질문을 단일 배치로 인코딩 (forward pass 1회)
+            embeddings = self._encode(documents + [question])
+            doc_emb, q_emb = embeddings[:-1], embeddings[-1]
+            titles = list(documents)
+            doc_q = self._quantize(doc_emb)
+            self._title_cache[stock_code] = (digest, titles, doc_q)
+
+        # 질문은 float32 그대로 두고, 저장된 int8 행렬만 복원해 내적.
+        # 스케일(1/127)은 모든 행에 동일해 순위에 영향이 없으므로 생략합니다.
+        sims = doc_q.astype(np.float32) @ q_emb
+        k = min(n_results, len(titles))
+        top = np.argpartition(-sims, k - 1)[:k]
+        top = top[np.argsort(-sims[top])]
+        return [titles[i] for i in top]
+
+    @staticmethod
+    def _quantize(embeddings: np.ndarray) -> np.ndarray:
+        """L2 정규화된 임베딩을 int8 대칭 양자화(스케일 127)합니다."""
+        return np.clip(np.round(embeddings * 127.0), -127, 127).astype(np.int8)
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """임베딩 함수를 호출해 L2 정규화된 float 행렬을 반환합니다."""
+        embeddings = np.asarray(self.ef(texts), dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.where(norms > 0, norms, 1.0)
+
     def query(self, stock_code: str, question: str, n_results: int = 5) -> List[str]:
         """질문과 가장 유사한 문서를 검색합니다."""
         # 저장할 때와 동일한 이름 규칙 적용
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -9,12 +10,12 @@ from contextlib import asynccontextmanager
 import httpx
 import jinja2
 import redis.asyncio as redis
-from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import REDIS_URL, TZ, logging_config
-from app.db.database import engine, get_db
+from app.db.database import SessionLocal, engine
 from app.db.db_models import Base
 from app.llm.llm_clients import GeminiChatClient  # 사용할 LLM 클라이언트들 임포트
 from app.llm.llm_clients import OpenAIChatClient
@@ -23,17 +24,25 @@ from app.routers import backtest, basic_analysis, history, market, opinion, repo
 from app.services.analysis import AnalysisService
 from app.services.sentiment import sentiment_lifespan
 
-load_dotenv()
+# .env 로딩은 app.config 임포트 시점에 한 번만 수행됩니다.
 logging.basicConfig(**logging_config)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # 애플리케이션 시작 시 데이터베이스 테이블을 생성
-    Base.metadata.create_all(bind=engine)
-
     # Redis 연결 풀을 생성하여 애플리케이션 상태에 저장
-    app.state.redis = redis.from_url(REDIS_URL, encoding="utf-8", decode_responses=True)
+    # 기본 from_url 풀은 크기 제한이 없어 버스트 시 소켓이 무한정 늘어나므로,
+    # 크기를 고정한 BlockingConnectionPool을 사용해 초과 요청은 대기시킵니다.
+    # (GET/SET 위주 워크로드라 슬롯 32개면 충분)
+    # decode_responses는 끕니다: 큰 JSON 블롭은 orjson이 bytes를 직접
+    # 파싱하므로 응답마다 UTF-8 디코딩을 거칠 필요가 없고, 문자열이
+    # 필요한 소수 호출부에서만 직접 decode합니다.
+    redis_pool = redis.BlockingConnectionPool.from_url(
+        REDIS_URL,
+        max_connections=32,
+        timeout=5,
+    )
+    app.state.redis = redis.Redis(connection_pool=redis_pool)
     app.state.tz = TZ
 
     # 자주 사용되는 유틸리티 함수를 애플리케이션 상태에 등록
@@ -42,27 +51,55 @@ async def lifespan(app: FastAPI):
     app.state.lookup_stock_info = _fetch_stock_info
 
     # LLM 프롬프트에 사용될 Jinja2 템플릿 환경 설정
+    # 템플릿은 배포 중 변하지 않으므로 렌더마다 파일 stat을 하지 않고
+    # (auto_reload=False), 컴파일 캐시도 무제한(cache_size=-1)으로 둡니다.
+    # trim/lstrip_blocks로 {% if %}/{% for %} 줄이 남기는 공백 줄과 들여쓰기를
+    # 제거해 LLM에 보내는 프롬프트 토큰 수를 줄입니다.
     app.state.jinja_env = jinja2.Environment(
-        loader=jinja2.FileSystemLoader("app/llm/templates")
+        loader=jinja2.FileSystemLoader("app/llm/templates"),
+        auto_reload=False,
+        cache_size=-1,
+        trim_blocks=True,
+        lstrip_blocks=True,
     )
+    def _warm_templates():
+        # 첫 요청에서 컴파일 비용을 지불하지 않도록 기동 시점에 전부 예열
+        for template_name in app.state.jinja_env.loader.list_templates():
+            app.state.jinja_env.get_template(template_name)
 
     # 외부 API 호출을 위한 HTTP 클라이언트 생성
-    app.state.http_client = httpx.AsyncClient()
+    # 백테스트/뉴스 경로는 종목 수만큼 동시 요청을 내보내므로 기본 커넥션
+    # 한도(100)로는 대기열이 생깁니다. 한도를 넉넉히 올리고, 같은 호스트로
+    # 몰리는 호출은 HTTP/2 멀티플렉싱으로 처리합니다.
+    app.state.http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
+        timeout=httpx.Timeout(10.0, connect=3.0),
+        http2=True,
+    )
 
     # 환경 변수(LLM_PROVIDER)에 따라 사용할 LLM 클라이언트를 동적으로 선택
-    llm_provider = os.getenv("LLM_PROVIDER", "openai").lower()
-    app.state.llm_client = None
-
-    logging.info(f"선택된 LLM 공급자: {llm_provider}")
-
-    if llm_provider == "openai":
-        api_key = os.getenv("OPENAI_API_KEY")
-        if api_key:
-            app.state.llm_client = OpenAIChatClient(api_key=api_key)
-    elif llm_provider == "gemini":
-        api_key = os.getenv("GEMINI_API_KEY")
-        if api_key:
-            app.state.llm_client = GeminiChatClient(api_key=api_key)
+    def _make_llm_client():
+        llm_provider = os.getenv("LLM_PROVIDER", "openai").lower()
+        logging.info(f"선택된 LLM 공급자: {llm_provider}")
+
+        if llm_provider == "openai":
+            api_key = os.getenv("OPENAI_API_KEY")
+            if api_key:
+                return OpenAIChatClient(api_key=api_key)
+        elif llm_provider == "gemini":
+            api_key = os.getenv("GEMINI_API_KEY")
+            if api_key:
+                return GeminiChatClient(api_key=api_key)
+        return None
+
+    # 서로 독립적인 기동 작업(DDL 확인, 템플릿 예열, LLM 클라이언트 생성)을
+    # 순차 실행하지 않고 스레드에서 동시에 수행합니다. 감성 분석 모델은
+    # sentiment_lifespan이 이미 백그라운드 태스크로 로드합니다.
+    _, _, app.state.llm_client = await asyncio.gather(
+        asyncio.to_thread(Base.metadata.create_all, bind=engine),
+        asyncio.to_thread(_warm_templates),
+        asyncio.to_thread(_make_llm_client),
+    )
 
     if app.state.llm_client is None:
         logging.warning(
@@ -73,8 +110,8 @@ async def lifespan(app: FastAPI):
     app.state.rag_engine = rag_engine
 
     # lifespan 동안 사용할 DB 세션 생성
-    db_session_generator = get_db()
-    db = next(db_session_generator)
+    # (요청 스코프용 제너레이터를 next()로 우회하지 않고 직접 엽니다)
+    db = SessionLocal()
 
     try:
         # AnalysisService를 애플리케이션 상태에 추가
@@ -89,8 +126,9 @@ async def lifespan(app: FastAPI):
             yield
     # 애플리케이션 종료 시 리소스 정리
     finally:
-        next(db_session_generator, None)  # DB 세션 정리
+        db.close()  # DB 세션 정리
         await app.state.redis.close()
+        await redis_pool.disconnect()
         await app.state.http_client.aclose()
         if app.state.llm_client:
             await app.state.llm_client.close()
@@ -102,6 +140,9 @@ app = FastAPI(
     title="Friendantial",
     version="1.0",
     lifespan=lifespan,
+    # 숫자 위주 페이로드(백테스트/추천 목록) 직렬화에 stdlib json 대비
+    # 수 배 빠른 orjson을 기본 응답 클래스로 사용합니다.
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -130,4 +171,12 @@ def health():
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    # uvloop/httptools(C 구현 루프·파서)를 명시해 이벤트 루프 오버헤드를 줄입니다.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        reload=True,
+    )
@@ -1,10 +1,11 @@
 # app/routers/backtest.py
 
 import logging
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 from typing import Optional
 
 import httpx
+import numpy as np
 import redis.asyncio as redis
 from fastapi import APIRouter, Depends, Query
 
@@ -52,9 +53,8 @@ async def backtest_strategy(
     results = []
 
     # 3. 추천일로부터 7일 후의 수익률 확인
-    future_date = (
-        datetime.strptime(target_date, "%Y-%m-%d") + timedelta(days=7)
-    ).strftime("%Y-%m-%d")
+    # strptime(순수 파이썬, 로케일 인식) 대신 C 구현인 fromisoformat 사용
+    future_date = (date.fromisoformat(target_date) + timedelta(days=7)).isoformat()
 
     # 모든 추천 종목의 미래 데이터를 한 번에 조회
     # 참고: lookback_days=10은 미래 시점(future_date) 기준 과거 10일치 데이터를 가져온다는 의미입니다.
@@ -67,24 +67,30 @@ async def backtest_strategy(
         lookback_days=10,
     )
 
-    for reco_item in recommended_stocks:
-        buy_price = reco_item.price
-        future_df = future_data_map.get(reco_item.code)
+    # 수익률은 종목별 pandas 스칼라 접근 대신 매수/매도가 배열을 쌓아
+    # 한 번의 NumPy 연산으로 일괄 계산합니다.
+    buy = np.array([s.price for s in recommended_stocks], dtype=np.float64)
+    sell = np.array(
+        [
+            future_df["close"].to_numpy()[-1]
+            if (future_df := future_data_map.get(s.code)) is not None
+            and not future_df.empty
+            else np.nan
+            for s in recommended_stocks
+        ],
+        dtype=np.float64,
+    )
+    has_future = ~np.isnan(sell)
+    profit_pcts = np.divide(sell - buy, buy, out=np.zeros_like(buy), where=buy > 0)
 
-        if future_df is None or future_df.empty:
+    for i, reco_item in enumerate(recommended_stocks):
+        if not has_future[i]:
             profit = "N/A"
             result_msg = "미래 데이터 없음"
         else:
-            try:
-                sell_price = future_df["close"].iloc[-1]
-                profit_pct = (
-                    (sell_price - buy_price) / buy_price if buy_price > 0 else 0
-                )
-                profit = f"{profit_pct:.2%}"
-                result_msg = "성공(수익)" if profit_pct > 0 else "실패(손실)"
-            except (IndexError, ZeroDivisionError):
-                profit = "N/A"
-                result_msg = "수익률 계산 실패"
+            profit_pct = profit_pcts[i]
+            profit = f"{profit_pct:.2%}"
+            result_msg = "성공(수익)" if profit_pct > 0 else "실패(손실)"
 
         results.append(
             {
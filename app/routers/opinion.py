@@ -1,8 +1,11 @@
 # app/routers/opinion/opinion.py
 
+import asyncio
+
 import httpx
 import redis.asyncio as redis
 from fastapi import APIRouter, Depends, Path, Query, Request
+from fastapi.responses import StreamingResponse
 from jinja2 import Environment
 
 from app.dependencies import (
@@ -11,7 +14,7 @@ from app.dependencies import (
     get_llm_client,
     get_redis_connection,
 )
-from app.llm.llm_service import generate_text_with_persona
+from app.llm.llm_service import generate_text_with_persona, stream_text_with_persona
 from app.llm.prompt_builder import build_prompt
 from app.schemas.enums import PersonaEnum
 from app.services.analysis import AnalysisService
@@ -35,6 +38,7 @@ async def ask_about_stock(
     stock_code: str = Path(..., description="종목 코드 (예: 005930.KS)"),
     question: str = Query(..., description="질문 내용 (예: 이 종목 왜 떨어져?)"),
     persona: PersonaEnum = Query(PersonaEnum.FRIEND, description="에이전트 성격 선택"),
+    stream: bool = Query(False, description="SSE로 답변을 스트리밍할지 여부"),
     analysis_service: AnalysisService = Depends(get_analysis_service),
     client: httpx.AsyncClient = Depends(get_http_client),
     jinja_env: Environment = Depends(get_jinja_env),
@@ -56,16 +60,17 @@ async def ask_about_stock(
     if not news_titles:
         return {"answer": "관련된 최신 뉴스를 찾지 못해서 답변하기 어렵습니다. 😢"}
 
-    # 3. RAG: 벡터 DB에 저장 및 검색
+    # 3. RAG: 적재와 검색을 한 번의 인코더 호출로 처리
+    # (뉴스 집합이 그대로면 엔진이 제목 임베딩을 재사용하고 질문만 인코딩)
+    # 인코딩은 수십 ms의 동기 CPU 작업이므로 이벤트 루프를 막지 않도록
+    # 스레드로 위임합니다.
     rag_engine = request.app.state.rag_engine
-    # (1) 지식 저장 (Ingestion)
-    rag_engine.create_collection(stock_code, news_titles)
-
-    # (2) 관련 문서 검색 (Retrieval)
-    relevant_news = rag_engine.query(stock_code, question, n_results=5)
+    relevant_news = await asyncio.to_thread(
+        rag_engine.ingest_and_query, stock_code, news_titles, question, 5
+    )
 
     # 4. 프롬프트 구성
-    context_text = "\n".join([f"- {title}" for title in relevant_news])
+    context_text = "\n".join(f"- {title}" for title in relevant_news)
 
     user_prompt = build_prompt(
         jinja_env,
@@ -78,6 +83,22 @@ async def ask_about_stock(
     )
 
     # 5. LLM 답변 생성
+    # 스트리밍 요청이면 전체 응답을 버퍼링하지 않고 생성되는 대로
+    # SSE(text/event-stream)로 흘려보냅니다. 캐시 히트는 한 조각으로 전달.
+    if stream:
+
+        async def sse_gen():
+            async for chunk in stream_text_with_persona(
+                persona_name=persona.value,
+                user_prompt=user_prompt,
+                llm_client=llm_client,
+                redis_conn=redis_conn,
+                jinja_env=jinja_env,
+            ):
+                yield "data: " + chunk.replace("\n", "\ndata: ") + "\n\n"
+
+        return StreamingResponse(sse_gen(), media_type="text/event-stream")
+
     answer = await generate_text_with_persona(
         persona_name=persona.value,
         user_prompt=user_prompt,
@@ -5,11 +5,12 @@ from typing import Any
 
 import redis.asyncio as redis
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi.responses import StreamingResponse
 from jinja2 import Environment
 
 from app.core.strategies import get_strategy
 from app.dependencies import get_jinja_env, get_llm_client, get_redis_connection
-from app.llm.llm_service import generate_text_with_persona
+from app.llm.llm_service import generate_text_with_persona, stream_text_with_persona
 from app.llm.prompt_builder import build_prompt
 from app.routers.basic_analysis import get_analysis_service
 from app.schemas.enums import PersonaEnum, StrategyEnum
@@ -17,6 +18,10 @@ from app.services.analysis import AnalysisService
 
 router = APIRouter(prefix="/reporting", tags=["reporting"])
 
+# 전략별 관점 문구는 불변이므로 모듈 로드 시 한 번만 조회해 둡니다.
+# (get_strategy는 미등록 이름을 기본 전략으로 폴백하며, 그 동작도 그대로 보존됨)
+_PERSPECTIVE_CACHE = {s: get_strategy(s.value).description for s in StrategyEnum}
+
 
 @router.get("/summary", summary="최신 추천 결과 요약 보고서 생성")
 async def create_summary_report(
@@ -37,7 +42,7 @@ async def create_summary_report(
         reco_response = await analysis_service.get_recommendations(strategy=strategy)
 
         # 2. 전략별 관점 설정
-        perspective_instruction = get_strategy(strategy.value).description
+        perspective_instruction = _PERSPECTIVE_CACHE[strategy]
 
         # 3. 템플릿 렌더링
         user_prompt = build_prompt(
@@ -69,6 +74,7 @@ async def create_summary_report(
 async def create_stock_report(
     stock_code: str = Path(..., description="종목 코드 (예: 005930.KS)"),
     persona: PersonaEnum = Query(PersonaEnum.FRIEND, description="에이전트 성격 선택"),
+    stream: bool = Query(False, description="SSE로 리포트를 스트리밍할지 여부"),
     analysis_service: AnalysisService = Depends(get_analysis_service),
     llm_client: Any = Depends(get_llm_client),
     jinja_env: Environment = Depends(get_jinja_env),
@@ -92,6 +98,22 @@ async def create_stock_report(
             news_analysis=analysis["news_analysis"],
         )
 
+        # 스트리밍 요청이면 리포트를 버퍼링하지 않고 생성되는 대로
+        # SSE(text/event-stream)로 흘려보냅니다. 캐시 히트는 한 조각으로 전달.
+        if stream:
+
+            async def sse_gen():
+                async for chunk in stream_text_with_persona(
+                    persona_name=persona.value,
+                    user_prompt=user_prompt,
+                    llm_client=llm_client,
+                    redis_conn=redis_conn,
+                    jinja_env=jinja_env,
+                ):
+                    yield "data: " + chunk.replace("\n", "\ndata: ") + "\n\n"
+
+            return StreamingResponse(sse_gen(), media_type="text/event-stream")
+
         report = await generate_text_with_persona(
             persona_name=persona.value,
             user_prompt=user_prompt,
@@ -1,9 +1,10 @@
 # app/schemas/models.py
 
 from datetime import date, datetime
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 # --- 공통 모델 ---
@@ -18,6 +19,19 @@ class FeatureConf(BaseModel):
     mom_long: int = 60
     min_turnover_won: float = 5e9
 
+    @cached_property
+    def mom_keys(self) -> Tuple[str, str, str]:
+        """모멘텀 컬럼 키 ("mom5", "mom20", "mom60") 튜플입니다.
+
+        score_stock이 종목마다 f-string으로 키를 새로 만들지 않도록
+        설정 객체에 한 번만 생성해 캐시해 둡니다.
+        """
+        return (
+            f"mom{self.mom_short}",
+            f"mom{self.mom_med}",
+            f"mom{self.mom_long}",
+        )
+
 
 class StockScore(StockBase):
     score: float
@@ -36,6 +50,9 @@ class NewsSentimentDetail(BaseModel):
 class NewsSentiment(BaseModel):
     summary: str
     details: List[NewsSentimentDetail]
+    # '강력한 악재' 포함 여부. 분석 단계에서 미리 판정해 두어
+    # 별점 계산 시 details를 다시 훑지 않도록 합니다.
+    strong_negative: bool = False
 
 
 # 추천 로직에서 반환
@@ -56,19 +73,17 @@ class RecoResponse(BaseModel):
 
 # --- History API를 위한 모델 ---
 class RecommendedStockHistoryItem(StockBase):
+    model_config = ConfigDict(from_attributes=True)
+
     score: float
     weight: float
     reason: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 
 class RecommendationRunHistoryItem(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     as_of: date
     created_at: datetime
     stocks: List[RecommendedStockHistoryItem]
-
-    class Config:
-        from_attributes = True
@@ -1,9 +1,13 @@
 import asyncio
+import hashlib
 import logging
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
+import numpy as np
+import orjson
 import pandas as pd
 import redis.asyncio as redis
 from fastapi import HTTPException
@@ -15,9 +19,16 @@ from app.core.presentation import (
     calculate_stock_stars,
     generate_friendly_reason,
     generate_ma_comment,
-    scale_to_100,
+    scale_to_100_batch,
+)
+from app.core.scoring import (
+    calculate_z_scores_prepared,
+    compute_features,
+    compute_features_batch,
+    prepare_z_stats,
+    score_stock,
+    score_stock_batch,
 )
-from app.core.scoring import calculate_z_scores, compute_features, score_stock
 from app.db.db_models import RecommendationRun, RecommendedStock
 from app.schemas.enums import StrategyEnum
 from app.schemas.models import FeatureConf, RecoItem, RecoResponse, StockScore
@@ -25,10 +36,37 @@ from app.services.market_data import (
     _fetch_stock_info,
     fetch_ohlcv,
     get_stock_name_from_code,
+    to_long_frame,
+)
+from app.services.sentiment import (
+    analyze_news_sentiment,
+    analyze_news_sentiment_batch,
+    fetch_news_titles,
 )
-from app.services.sentiment import analyze_news_sentiment, fetch_news_titles
 from app.services.universe import get_universe
 
+# 피쳐 계산 결과 인메모리 캐시: 같은 (as_of, 입력 데이터) 조합의 요청이
+# 반복될 때 배치 파이프라인 전체를 건너뜁니다. DataFrame 맵은 Redis에
+# 직렬화하기에 크고 복원 비용도 커서 프로세스 로컬 TTL 캐시를 사용합니다.
+_FEATURES_CACHE: Dict[tuple, Tuple[float, dict, dict]] = {}
+_FEATURES_CACHE_TTL_SECONDS = 3600
+_FEATURES_CACHE_MAX_ENTRIES = 8
+
+# 기본 피쳐 설정은 요청마다 달라지지 않으므로 모듈 로드 시 한 번만 생성합니다.
+# (pydantic 모델 생성/검증 비용을 요청 경로에서 제거)
+_DEFAULT_CONF = FeatureConf()
+
+
+def _features_cache_key(as_of: str, eligible: Dict[str, pd.DataFrame]) -> tuple:
+    """(as_of, 종목별 길이/마지막 종가) 기반의 내용 주소화 캐시 키를 만듭니다."""
+    fingerprint = tuple(
+        sorted(
+            (code, len(df), float(df["close"].values[-1]))
+            for code, df in eligible.items()
+        )
+    )
+    return (as_of, hash(fingerprint))
+
 
 class AnalysisService:
     """주식 분석 관련 비즈니스 로직을 처리하는 서비스입니다."""
@@ -122,7 +160,7 @@ class AnalysisService:
             lookback_days=120,
         )
 
-        conf = FeatureConf()
+        conf = _DEFAULT_CONF
 
         # 2. 시장 상황 분석
         market_regime = await determine_market_regime(
@@ -130,41 +168,94 @@ class AnalysisService:
         )
 
         # 3. 피쳐 계산 및 모멘텀 통계 산출
+        # 종목별 compute_features 반복 호출 대신 (code, date) 장형 프레임
+        # 하나에 대해 groupby 파이프라인으로 일괄 계산합니다.
         features_map = {}
-        mom_values = {
-            f"mom{p}": [] for p in [conf.mom_short, conf.mom_med, conf.mom_long]
+        prev_mom_map: Dict[str, Dict[str, float]] = {}
+
+        # 이력이 짧아 어차피 채점에서 탈락할 종목(신규 상장, 거래 정지 등)은
+        # 피쳐 계산 전에 걸러내어 배치 파이프라인이 해당 구간을 돌지 않게 합니다.
+        eligible = {
+            code: df
+            for code, df in data.items()
+            if df is not None and len(df) >= conf.mom_long + 2
         }
 
-        for code in codes:
-            df = data.get(code)
-            if df is not None and not df.empty and len(df) >= conf.mom_long + 2:
-                features_map[code] = self._compute_stock_features(df, conf)
-                prev = features_map[code].iloc[-2]
-                for k in mom_values.keys():
-                    mom_values[k].append(float(prev.get(k, 0.0)))
-        mom_stats = {
-            key: (pd.Series(vals).mean(), pd.Series(vals).std())
-            for key, vals in mom_values.items()
-        }
+        cache_key = _features_cache_key(as_of, eligible)
+        cached = _FEATURES_CACHE.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            _, features_map, prev_mom_map = cached
+        else:
+            df_long = to_long_frame(eligible)
+            if not df_long.empty:
+                # CPU를 쓰는 배치 피쳐 계산이 이벤트 루프를 막지 않도록 워커
+                # 스레드로 넘깁니다. (pandas/numba 커널은 GIL을 풀어주므로
+                # 스레드 오프로딩으로 충분)
+                features_long = await asyncio.to_thread(
+                    compute_features_batch, df_long, conf
+                )
+                # 전일(-2) 행 추출도 종목 루프 없이 groupby.nth로 일괄 수행
+                mom_prev = features_long.groupby(level="code", sort=False).nth(-2)
+                mom_prev = mom_prev.droplevel("date")[list(conf.mom_keys)]
+                prev_mom_map = {
+                    code: dict(zip(conf.mom_keys, map(float, row)))
+                    for code, row in zip(mom_prev.index, mom_prev.to_numpy())
+                }
+                for code, feat in features_long.groupby(level="code", sort=False):
+                    features_map[code] = feat.droplevel("code")
+
+            if len(_FEATURES_CACHE) >= _FEATURES_CACHE_MAX_ENTRIES:
+                # 가장 먼저 만료되는 항목 하나를 밀어내는 단순 정책
+                oldest = min(_FEATURES_CACHE, key=lambda k: _FEATURES_CACHE[k][0])
+                _FEATURES_CACHE.pop(oldest, None)
+            _FEATURES_CACHE[cache_key] = (
+                time.monotonic() + _FEATURES_CACHE_TTL_SECONDS,
+                features_map,
+                prev_mom_map,
+            )
 
-        # 4. 1차 스코어링 (Z-Score 기반)
-        pre_scored_stocks = []
-        for code, feat in features_map.items():
-            prev = feat.iloc[-2]
-            z_scores = calculate_z_scores(prev, mom_stats)
-            stock_score = score_stock(
-                code,
-                code_to_name_map.get(code, code),
-                feat,
-                z_scores,
-                0.0,
-                0.0,
-                conf,
-                market_regime,
-                strategy,
+        # 모멘텀 통계는 키별 리스트 누적 대신 (종목 × 모멘텀) 행렬 하나에
+        # 대한 축 단위 mean/std로 계산합니다.
+        # 표본 표준편차(ddof=1)를 사용해 기존 pd.Series.std와 동일하게 계산
+        if prev_mom_map:
+            mom_matrix = np.array(
+                [[moms[k] for k in conf.mom_keys] for moms in prev_mom_map.values()]
             )
-            if stock_score:
-                pre_scored_stocks.append(stock_score)
+            mom_means = mom_matrix.mean(axis=0)
+            mom_stds = np.std(mom_matrix, axis=0, ddof=1)
+            mom_stats = {
+                k: (float(mom_means[i]), float(mom_stds[i]))
+                for i, k in enumerate(conf.mom_keys)
+            }
+        else:
+            mom_stats = {k: (float("nan"), float("nan")) for k in conf.mom_keys}
+        # Z-Score 분모(1/std)는 코호트 단위로 한 번만 계산해 둡니다.
+        z_stats = prepare_z_stats(mom_stats)
+
+        # 4. 1차 스코어링 (Z-Score 기반)
+        # mom_stats는 이후 단계에서 변하지 않으므로 종목별 Z-Score를
+        # 캐시해 두고 2차 스코어링에서 그대로 재사용합니다.
+        z_cache: Dict[str, Dict[str, float]] = {
+            code: calculate_z_scores_prepared(prev_mom_map[code], *z_stats)
+            for code in features_map
+        }
+
+        # 종목별 score_stock 호출 대신 코호트 전체를 배열로 일괄 채점합니다.
+        # (유니버스 규모에 비례하던 Python 루프 산식이 NumPy 연산으로 축약됨)
+        batch_codes = list(features_map.keys())
+        zeros = [0.0] * len(batch_codes)
+        batch_scores = score_stock_batch(
+            batch_codes,
+            [code_to_name_map.get(c, c) for c in batch_codes],
+            [features_map[c] for c in batch_codes],
+            [z_cache[c] for c in batch_codes],
+            zeros,
+            zeros,
+            conf,
+            market_regime,
+            strategy,
+        )
+        pre_scored_stocks = [s for s in batch_scores if s is not None]
 
         if not pre_scored_stocks:
             raise HTTPException(status_code=503, detail="채점 가능한 종목이 없습니다.")
@@ -175,44 +266,52 @@ class AnalysisService:
         # 5. 뉴스 감성 분석
         news_data_map = {}
         if with_news:
-            all_titles = []
-            batch_size = 5
-
-            for i in range(0, len(pre_selected_codes), batch_size):
-                batch_codes = pre_selected_codes[i : i + batch_size]
-                tasks = [
-                    fetch_news_titles(
+            # 배치 5개 + sleep으로 직렬화하는 대신, 세마포어로 동시 요청 수만
+            # 제한하고 전체를 한 번의 gather로 처리합니다.
+            # (단계 소요 시간이 가장 느린 배치들의 합 → 가장 느린 요청 하나로 단축)
+            news_semaphore = asyncio.Semaphore(5)
+
+            async def fetch_one(code: str) -> list:
+                async with news_semaphore:
+                    return await fetch_news_titles(
                         self.http_client,
                         code_to_name_map.get(code) or code,
                         limit=NEWS_MAX,
                     )
-                    for code in batch_codes
-                ]
 
-                batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-                all_titles.extend(batch_results)
-
-                await asyncio.sleep(0.5)  # API 호출 간 지연
+            all_titles = await asyncio.gather(
+                *(fetch_one(code) for code in pre_selected_codes),
+                return_exceptions=True,
+            )
 
+            # 종목별로 파이프라인을 따로 태우지 않고 전체 제목을 한 번에 추론
+            titles_by_code = {}
             for code, titles in zip(pre_selected_codes, all_titles):
-
                 if isinstance(titles, list) and titles:
-                    news_data_map[code] = await asyncio.to_thread(
-                        analyze_news_sentiment, self.sentiment_pipe, titles
-                    )
+                    titles_by_code[code] = titles
                 else:
                     news_data_map[code] = {
                         "score": 0.0,
                         "summary": "뉴스 없음",
                         "details": [],
+                        "strong_negative": False,
                     }
 
+            if titles_by_code:
+                news_data_map.update(
+                    await asyncio.to_thread(
+                        analyze_news_sentiment_batch,
+                        self.sentiment_pipe,
+                        titles_by_code,
+                    )
+                )
+
         # 6. 2차 스코어링: 뉴스 감성 점수와 변동성을 추가로 반영
         raw_scored_stocks = self._perform_final_scoring(
             pre_selected_codes,
             features_map,
             news_data_map,
-            mom_stats,
+            z_cache,
             code_to_name_map,
             conf,
             market_regime,
@@ -234,7 +333,7 @@ class AnalysisService:
         codes: list[str],
         features_map: dict,
         news_data_map: dict,
-        mom_stats: dict,
+        z_cache: dict,
         code_to_name_map: dict,
         conf: FeatureConf,
         market_regime: str,
@@ -243,24 +342,29 @@ class AnalysisService:
         """뉴스 감성 점수와 변동성을 반영하여 최종 점수를 계산합니다."""
 
         news_scores = [news_data_map.get(c, {}).get("score", 0.0) for c in codes]
-        vol_scores = [
-            float(features_map[c]["ret1"].rolling(20).std().iloc[-2]) for c in codes
-        ]
-        news_mean, news_std = (
-            pd.Series(news_scores).mean(),
-            pd.Series(news_scores).std(),
-        )
-        vol_mean, vol_std = pd.Series(vol_scores).mean(), pd.Series(vol_scores).std()
+        # rolling(20).std()는 전체 시계열을 훑지만 필요한 값은 index -2 하나뿐이므로
+        # ret1 꼬리 20개 구간의 std만 직접 계산해 종목별로 한 번씩 캐시합니다.
+        vol_map = {
+            c: float(
+                np.nanstd(features_map[c]["ret1"].to_numpy()[-21:-1], ddof=1)
+            )
+            for c in codes
+        }
+        vol_scores = list(vol_map.values())
+        news_mean = float(np.mean(news_scores))
+        news_std = float(np.std(news_scores, ddof=1))
+        vol_mean = float(np.mean(vol_scores))
+        vol_std = float(np.std(vol_scores, ddof=1))
         raw_scored_stocks = []
 
         for code in codes:
             feat = features_map[code]
             n_score = news_data_map.get(code, {}).get("score", 0.0)
             n_z = (n_score - news_mean) / news_std if news_std > 0 else 0.0
-            v_val = float(feat["ret1"].rolling(20).std().iloc[-2])
+            v_val = vol_map[code]
             v_z = (v_val - vol_mean) / vol_std if vol_std > 0 else 0.0
-            prev = feat.iloc[-2]
-            z_scores = calculate_z_scores(prev, mom_stats)
+            # 1차 스코어링에서 캐시한 Z-Score를 그대로 재사용
+            z_scores = z_cache[code]
             s = score_stock(
                 code,
                 code_to_name_map.get(code, code),
@@ -292,17 +396,20 @@ class AnalysisService:
         if not raw_scored_stocks:
             return RecoResponse(as_of=as_of, candidates=[])
 
-        all_raw_scores = [s.score for s in raw_scored_stocks]
-        min_raw, max_raw = min(all_raw_scores), max(all_raw_scores)
+        # 항목별 scale_to_100 호출 대신 점수 배열을 한 번에 0~100으로 변환
+        raw_scores = np.fromiter(
+            (s.score for s in raw_scored_stocks), dtype=np.float64
+        )
+        min_raw, max_raw = float(raw_scores.min()), float(raw_scores.max())
+        final_scores = scale_to_100_batch(raw_scores, min_raw, max_raw, market_regime)
         scored = []
 
-        for s in raw_scored_stocks:
-            final_score = scale_to_100(s.score, min_raw, max_raw, market_regime)
+        for s, final_score in zip(raw_scored_stocks, final_scores):
             friendly_reason = generate_friendly_reason(s)
             temp_item = RecoItem(
                 code=s.code,
                 name=s.name,
-                score=final_score,
+                score=int(final_score),
                 stars=0,
                 weight=0.0,
                 price=s.price,
@@ -329,23 +436,26 @@ class AnalysisService:
             self.db.add(run)
             self.db.flush()
 
-            for item in items:
-                stock = RecommendedStock(
-                    run_id=run.id,
-                    code=item.code,
-                    name=item.name,
-                    score=item.score,
-                    weight=item.weight,
-                    reason=item.reason,
-                    momentum=item.momentum,
-                    news_sentiment=(
+            # 행마다 session.add 하지 않고 executemany INSERT 한 번으로 저장
+            rows = [
+                {
+                    "run_id": run.id,
+                    "code": item.code,
+                    "name": item.name,
+                    "score": item.score,
+                    "weight": item.weight,
+                    "reason": item.reason,
+                    "momentum": item.momentum,
+                    "news_sentiment": (
                         item.news_sentiment.model_dump()
                         if item.news_sentiment
                         and hasattr(item.news_sentiment, "model_dump")
                         else None
                     ),
-                )
-                self.db.add(stock)
+                }
+                for item in items
+            ]
+            RecommendedStock.bulk_insert(self.db, rows)
             self.db.commit()
 
         except Exception as e:
@@ -373,13 +483,14 @@ class AnalysisService:
 
         # 1. 기술적 분석 (입력값이 코드 형식일 때만 수행)
         if stock_code:
-            conf = FeatureConf()
-            data = await fetch_ohlcv(
-                self.http_client, self.redis_conn, [stock_code], lookback_days=120
-            )
-            # 추가: 종목의 최신 시장 정보를 가져옵니다.
-            market_info = await _fetch_stock_info(
-                self.http_client, self.redis_conn, stock_code
+            conf = _DEFAULT_CONF
+            # OHLCV와 시장 정보 조회는 서로 독립적인 네트워크 호출이므로
+            # 순차 await 대신 동시에 실행해 느린 쪽 하나만큼만 기다립니다.
+            data, market_info = await asyncio.gather(
+                fetch_ohlcv(
+                    self.http_client, self.redis_conn, [stock_code], lookback_days=120
+                ),
+                _fetch_stock_info(self.http_client, self.redis_conn, stock_code),
             )
             df = data.get(stock_code)
 
@@ -387,26 +498,56 @@ class AnalysisService:
                 # 데이터가 부족하면 기술적 분석은 건너뜁니다.
                 logging.warning(f"'{stock_code}'에 대한 기술적 분석 데이터 부족")
             else:
-                features_df = self._compute_stock_features(df, conf)
-                latest_features = features_df.iloc[-2]
-                price = latest_features.get("close", 0)
-                ma5 = latest_features.get("ma5", 0)
-                ma20 = latest_features.get("ma20", 0)
-                ma60 = latest_features.get("ma60", 0)
-                ma_comment = generate_ma_comment(price, ma5, ma20, ma60)
-
-                tech_analysis = {
-                    "price": int(price),  # 종가
-                    "ma5": round(ma5, 2),
-                    "ma20": round(ma20, 2),
-                    "ma60": round(ma60, 2),
-                    "volatility": round(latest_features.get("ret1", 0), 4),
-                    "close": int(price),
-                    "rsi": round(latest_features.get("rsi", 50.0), 2),
-                    "avg_vol20": round(latest_features.get("avg_vol20", 0), 2),
-                    "atr_ratio": round(latest_features.get("atr_ratio", 0), 4),
-                    "summary": ma_comment,
-                }
+                # compute_features는 순수 함수이므로 같은 (종목, 마지막 종가,
+                # 길이) 입력에 대한 결과 행을 Redis에 캐시해, 반복 조회 시
+                # rolling/RSI 파이프라인 전체를 건너뜁니다.
+                feat_key = "feat:" + hashlib.md5(
+                    f"{stock_code}:{float(df['close'].values[-1])}:{len(df)}".encode()
+                ).hexdigest()
+                cached_tech = None
+                try:
+                    cached_tech = await self.redis_conn.get(feat_key)
+                except Exception as e:
+                    logging.warning(f"기술적 지표 캐시 조회 실패: {e}")
+
+                if cached_tech:
+                    tech_analysis = orjson.loads(cached_tech)
+                else:
+                    # pandas/커널 연산이 이벤트 루프를 막지 않도록 스레드로 위임
+                    features_df = await asyncio.to_thread(
+                        self._compute_stock_features, df, conf
+                    )
+                    # Series.get은 호출마다 pandas 인덱서를 거치므로
+                    # 행을 평문 dict로 한 번만 변환해 조회합니다.
+                    latest_features = features_df.iloc[-2].to_dict()
+                    price = latest_features.get("close", 0)
+                    ma5 = latest_features.get("ma5", 0)
+                    ma20 = latest_features.get("ma20", 0)
+                    ma60 = latest_features.get("ma60", 0)
+                    ma_comment = generate_ma_comment(price, ma5, ma20, ma60)
+
+                    tech_analysis = {
+                        "price": int(price),  # 종가
+                        "ma5": round(ma5, 2),
+                        "ma20": round(ma20, 2),
+                        "ma60": round(ma60, 2),
+                        "volatility": round(latest_features.get("ret1", 0), 4),
+                        "close": int(price),
+                        "rsi": round(latest_features.get("rsi", 50.0), 2),
+                        "avg_vol20": round(latest_features.get("avg_vol20", 0), 2),
+                        "atr_ratio": round(latest_features.get("atr_ratio", 0), 4),
+                        "summary": ma_comment,
+                    }
+                    try:
+                        await self.redis_conn.set(
+                            feat_key,
+                            orjson.dumps(
+                                tech_analysis, option=orjson.OPT_SERIALIZE_NUMPY
+                            ),
+                            ex=3600,
+                        )
+                    except Exception as e:
+                        logging.warning(f"기술적 지표 캐시 저장 실패: {e}")
         else:
             # 입력값이 종목명인 경우
             stock_name = stock_identifier
@@ -1,12 +1,13 @@
 # app/services/market_data.py
 
 import asyncio
-import json
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
 import httpx
+import orjson
 import pandas as pd
 import redis.asyncio as redis
 from fastapi import HTTPException, status
@@ -68,19 +69,25 @@ async def fetch_ohlcv(
 
     full_df = pd.DataFrame(all_rows)
     # API 응답의 숫자 필드는 문자열이므로 숫자 형태로 변환
+    # (컬럼별 루프 대신 블록 단위 apply로 한 번에 변환)
     numeric_cols = ["clpr", "hipr", "lopr", "mkp", "trqu", "trPrc"]
-    for col in numeric_cols:
-        full_df[col] = pd.to_numeric(full_df[col], errors="coerce")
+    full_df[numeric_cols] = full_df[numeric_cols].apply(
+        pd.to_numeric, errors="coerce"
+    )
 
     # yfinance 티커 형식('######.KS')을 공공데이터포털 형식('######')으로 미리 변환
     code_mapping = {code: code.split(".")[0] for code in codes}
 
+    # 종목마다 전체 프레임을 불리언 스캔하는 대신 groupby로 한 번만 분할
+    by_code = dict(tuple(full_df.groupby("srtnCd", sort=False)))
+
     out: Dict[str, pd.DataFrame] = {}
     for code, clean_code in code_mapping.items():
-        df = full_df[full_df["srtnCd"] == clean_code].copy()
-        if df.empty:
+        df = by_code.get(clean_code)
+        if df is None or df.empty:
             out[code] = pd.DataFrame()
             continue
+        df = df.copy()
 
         df = df.rename(
             columns={
@@ -105,6 +112,21 @@ async def fetch_ohlcv(
     return out
 
 
+def to_long_frame(data: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """종목별 OHLCV 데이터프레임 dict를 (code, date) MultiIndex 장형 프레임으로 합칩니다.
+
+    종목마다 독립된 프레임을 유지하면 rolling/pct_change 연산이 종목 수만큼
+    디스패치되므로, 일괄 피쳐 계산(compute_features_batch)이 소비할 수 있는
+    메모리상 연속된 단일 프레임 레이아웃을 제공합니다.
+    """
+    frames = {
+        code: df for code, df in data.items() if df is not None and not df.empty
+    }
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, names=["code", "date"])
+
+
 async def _fetch_daily_prices(
     client: httpx.AsyncClient, redis_conn: redis.Redis, date: datetime.date
 ) -> List[Dict]:
@@ -119,61 +141,61 @@ async def _fetch_daily_prices(
             cached_data = await redis_conn.get(cache_key)
             if cached_data:
                 logging.debug("Reading from Redis cache: %s", cache_key)
-                return json.loads(cached_data)
+                # orjson은 bytes를 그대로 파싱하므로 decode를 거치지 않음
+                return orjson.loads(cached_data)
         except Exception as e:
             logging.warning("Redis cache read error, fetching from API: %s", e)
 
     url = "https://apis.data.go.kr/1160100/service/GetStockSecuritiesInfoService/getStockPriceInfo"
     all_items = []
-    page_no = 1
+    num_rows = 1000
 
-    while True:
+    async def _fetch_page(page_no: int) -> Tuple[List[Dict], int]:
         params = {
             "serviceKey": DATA_GO_KR_API_KEY,
             "basDt": date.strftime("%Y%m%d"),
             "resultType": "json",
-            "numOfRows": 1000,
+            "numOfRows": num_rows,
             "pageNo": page_no,
         }
-        try:
-            resp = await client.get(url, params=params, timeout=30.0)
-            resp.raise_for_status()
-            data = resp.json()
-            items = (
-                data.get("response", {})
-                .get("body", {})
-                .get("items", {})
-                .get("item", [])
-            )
-
-            if not items:
-                break  # 더 이상 데이터가 없으면 루프 종료
-
-            all_items.extend(items)
-
-            # 마지막 페이지인지 확인하여 모든 데이터를 가져옴
-            total_count = int(
-                data.get("response", {}).get("body", {}).get("totalCount", 0)
-            )
-            if page_no * params["numOfRows"] >= total_count:
-                break
-
-            page_no += 1
-            await asyncio.sleep(0.1)  # API 서버 부하 감소를 위해 짧은 지연
+        resp = await client.get(url, params=params, timeout=30.0)
+        resp.raise_for_status()
+        body = resp.json().get("response", {}).get("body", {})
+        items = body.get("items", {}).get("item", [])
+        return items, int(body.get("totalCount", 0))
 
-        except Exception as e:
-            logging.error(
-                "공공데이터 API 호출 실패 (date: %s, page: %s): %s", date, page_no, e
+    try:
+        # 첫 페이지로 totalCount를 확인한 뒤, 남은 페이지는 순차 왕복 대신
+        # 한 번의 gather로 동시에 가져옵니다. (페이지 수만큼 쌓이던 왕복
+        # 지연이 가장 느린 요청 하나로 축약됨)
+        items, total_count = await _fetch_page(1)
+        all_items.extend(items)
+        n_pages = -(-total_count // num_rows)  # ceil
+        if items and n_pages > 1:
+            results = await asyncio.gather(
+                *(_fetch_page(p) for p in range(2, n_pages + 1)),
+                return_exceptions=True,
             )
-            # 한 페이지라도 실패하면, 현재까지 수집된 데이터만 반환하고 중단
-            break
+            for page_no, res in enumerate(results, start=2):
+                if isinstance(res, BaseException):
+                    # 일부 페이지가 실패해도 수집된 데이터는 그대로 사용
+                    logging.error(
+                        "공공데이터 API 호출 실패 (date: %s, page: %s): %s",
+                        date,
+                        page_no,
+                        res,
+                    )
+                    continue
+                all_items.extend(res[0])
+    except Exception as e:
+        logging.error("공공데이터 API 호출 실패 (date: %s, page: 1): %s", date, e)
 
     if is_past_date and all_items:
         try:
             # 과거 데이터는 7일간 캐시
             await redis_conn.set(
                 cache_key,
-                json.dumps(all_items),
+                orjson.dumps(all_items),
                 ex=int(timedelta(days=7).total_seconds()),
             )
         except Exception as e:
@@ -194,7 +216,7 @@ async def _fetch_stock_info(
         cached_data = await redis_conn.get(cache_key)
         if cached_data:
             logging.debug("Redis 캐시에서 종목 정보를 읽습니다.: %s", cache_key)
-            return json.loads(cached_data)
+            return orjson.loads(cached_data)
     except Exception as e:
         logging.warning(
             "Redis 캐시에서 종목 정보를 읽는 중 오류가 발생했습니다.: %s", e
@@ -207,7 +229,7 @@ async def _fetch_stock_info(
             try:
                 await redis_conn.set(
                     cache_key,
-                    json.dumps(item),
+                    orjson.dumps(item),
                     ex=int(timedelta(days=1).total_seconds()),
                 )
             except Exception as e:
@@ -216,6 +238,25 @@ async def _fetch_stock_info(
     return None
 
 
+# 종목 코드 → 종목명 인메모리 캐시: 상장 종목명은 사실상 불변이므로
+# 핫한 종목은 Redis 왕복 없이 dict 조회로 끝냅니다. {코드: (만료시각, 이름)}
+_STOCK_NAME_CACHE: Dict[str, Tuple[float, str]] = {}
+_STOCK_NAME_CACHE_TTL_SECONDS = 3600
+_STOCK_NAME_CACHE_MAX_ENTRIES = 2048
+
+
+def _store_stock_name(stock_code: str, stock_name: str) -> None:
+    """인메모리 종목명 캐시에 항목을 추가합니다. (만료 우선 퇴출)"""
+    if len(_STOCK_NAME_CACHE) >= _STOCK_NAME_CACHE_MAX_ENTRIES:
+        # 가장 먼저 만료되는 항목 하나를 밀어내는 단순 정책
+        oldest = min(_STOCK_NAME_CACHE, key=lambda k: _STOCK_NAME_CACHE[k][0])
+        _STOCK_NAME_CACHE.pop(oldest, None)
+    _STOCK_NAME_CACHE[stock_code] = (
+        time.monotonic() + _STOCK_NAME_CACHE_TTL_SECONDS,
+        stock_name,
+    )
+
+
 async def get_stock_name_from_code(
     redis_conn: redis.Redis, client: httpx.AsyncClient, stock_code: str
 ) -> str:
@@ -227,11 +268,33 @@ async def get_stock_name_from_code(
     stock_name = stock_code
     # 입력이 '005930.KS'와 같은 코드 형식인지 확인
     if "." in stock_code:
+        cached = _STOCK_NAME_CACHE.get(stock_code)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        # 프로세스 간 공유되는 이름 전용 Redis 키를 먼저 확인합니다.
+        # (시세 전체 블롭을 역직렬화하는 stock-info 캐시보다 훨씬 가벼움)
+        name_key = f"stock:name:{stock_code}"
+        try:
+            cached_name = await redis_conn.get(name_key)
+            if cached_name:
+                if isinstance(cached_name, bytes):
+                    cached_name = cached_name.decode("utf-8")
+                _store_stock_name(stock_code, cached_name)
+                return cached_name
+        except Exception as e:
+            logging.warning(f"종목명 캐시 조회 실패({stock_code}): {e}")
+
         try:
             # 로컬 헬퍼 함수를 직접 호출
             stock_info = await _fetch_stock_info(client, redis_conn, stock_code)
             if stock_info:
                 stock_name = stock_info.get("itmsNm", stock_code)
+                _store_stock_name(stock_code, stock_name)
+                try:
+                    await redis_conn.set(name_key, stock_name, ex=86400)
+                except Exception as e:
+                    logging.warning(f"종목명 캐시 저장 실패({stock_code}): {e}")
         except Exception as e:
             logging.warning(
                 f"종목 정보 조회 실패({stock_code}): {e}. 코드로 계속 진행합니다."
@@ -1,5 +1,6 @@
 # app/utils/caching.py
 
+import asyncio
 import hashlib
 import logging
 from datetime import datetime, timedelta
@@ -22,6 +23,19 @@ def _find_redis_conn(*args, **kwargs) -> redis.Redis:
     )
 
 
+def build_llm_cache_key(prefix: str, persona_name: str, user_prompt: str) -> str:
+    """LLM 응답 캐시 키를 생성합니다. (일 단위 + 공백 정규화 프롬프트 해시)
+
+    데코레이터 경로와 스트리밍 경로가 같은 키를 공유하도록 분리된 헬퍼입니다.
+    공백/개행만 다른 프롬프트(같은 컨텍스트의 재조립 등)가 서로 다른
+    키로 갈라지지 않도록 공백을 정규화한 뒤 해시합니다.
+    """
+    today_str = datetime.now(TZ).date().isoformat()
+    normalized_prompt = " ".join(user_prompt.split())
+    prompt_hash = hashlib.md5(normalized_prompt.encode()).hexdigest()
+    return f"{prefix}:{today_str}:{persona_name}:{prompt_hash}"
+
+
 def cached_llm_generation(prefix: str, ttl_days: int = 1):
     """
     LLM 생성 함수의 결과를 캐싱하는 데코레이터입니다.
@@ -37,23 +51,45 @@ def cached_llm_generation(prefix: str, ttl_days: int = 1):
             user_prompt = kwargs.get("user_prompt", "")
 
             redis_conn = _find_redis_conn(*args, **kwargs)
-            today_str = datetime.now(TZ).date().isoformat()
-
-            prompt_hash = hashlib.md5(user_prompt.encode()).hexdigest()
-            cache_key = f"{prefix}:{today_str}:{persona_name}:{prompt_hash}"
+            cache_key = build_llm_cache_key(prefix, persona_name, user_prompt)
 
             # 1. 캐시 확인
             cached_result = await redis_conn.get(cache_key)
             if cached_result:
                 logging.info(f"LLM 응답 캐시 히트: {cache_key}")
+                # decode_responses를 끈 연결에서는 bytes로 돌아오므로 복원
+                if isinstance(cached_result, bytes):
+                    cached_result = cached_result.decode("utf-8")
                 return cached_result
 
-            # 2. 캐시 미스 시, 원본 함수(LLM 생성) 호출
+            # 2. 단일 비행(single-flight): 같은 프롬프트로 동시에 들어온
+            # 요청 중 첫 요청만 LLM을 호출하고, 나머지는 캐시가 채워질
+            # 때까지 폴링합니다. 버스트 상황에서 동일 프롬프트의 LLM
+            # 호출을 1회로 줄입니다.
+            lock_key = f"{cache_key}:lock"
+            acquired = await redis_conn.set(lock_key, "pending", nx=True, ex=30)
+            if not acquired:
+                logging.info(f"LLM 동일 프롬프트 생성 대기: {cache_key}")
+                for _ in range(60):
+                    await asyncio.sleep(0.5)
+                    cached_result = await redis_conn.get(cache_key)
+                    if cached_result:
+                        if isinstance(cached_result, bytes):
+                            cached_result = cached_result.decode("utf-8")
+                        return cached_result
+                    if not await redis_conn.exists(lock_key):
+                        # 선행 요청이 결과 없이 사라짐 → 직접 호출로 폴백
+                        break
+
+            # 3. 캐시 미스 시, 원본 함수(LLM 생성) 호출
             logging.info(f"LLM 응답 캐시 미스: {cache_key}")
-            result = await func(*args, **kwargs)
-
-            # 3. 결과를 캐시에 저장
-            await redis_conn.set(cache_key, result, ex=timedelta(days=ttl_days))
+            try:
+                result = await func(*args, **kwargs)
+                # 4. 결과를 캐시에 저장
+                await redis_conn.set(cache_key, result, ex=timedelta(days=ttl_days))
+            finally:
+                if acquired:
+                    await redis_conn.delete(lock_key)
             return result
 
         return wrapper
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+from app.core.ta_kernels import atr_kernel, rsi_kernel, sma_kernel
+
+
+def test_rsi_kernel_matches_wilder_reference():
+    """RSI 커널이 Wilder's Smoothing 참조 구현(ewm)과 일치하는지 확인합니다."""
+    rng = np.random.default_rng(42)
+    closes = np.cumsum(rng.normal(0, 1, 120)) + 100
+    period = 14
+
+    # pandas ewm 기반 참조 구현 (SMA 시드 포함)
+    delta = pd.Series(closes).diff()
+    gain = delta.clip(lower=0)
+    loss = -delta.clip(upper=0)
+    avg_gain = gain.rolling(period).mean()
+    avg_loss = loss.rolling(period).mean()
+    ref = np.full(len(closes), np.nan)
+    ag, al = avg_gain.iloc[period], avg_loss.iloc[period]
+    ref[period] = 100 - 100 / (1 + ag / al) if al > 0 else 100.0
+    for i in range(period + 1, len(closes)):
+        ag = (ag * (period - 1) + gain.iloc[i]) / period
+        al = (al * (period - 1) + loss.iloc[i]) / period
+        ref[i] = 100 - 100 / (1 + ag / al) if al > 0 else 100.0
+
+    got = rsi_kernel(closes, period)
+
+    # 워밍업 구간은 NaN 유지
+    assert np.isnan(got[:period]).all()
+    assert np.allclose(got, ref, equal_nan=True)
+
+
+def test_atr_kernel_positive_and_warmup(sample_ohlcv_data):
+    """ATR 커널의 워밍업 NaN과 양수성을 확인합니다."""
+    df = sample_ohlcv_data
+    period = 14
+    got = atr_kernel(
+        df["high"].to_numpy(dtype=np.float64),
+        df["low"].to_numpy(dtype=np.float64),
+        df["close"].to_numpy(dtype=np.float64),
+        period,
+    )
+
+    assert np.isnan(got[:period]).all()
+    valid = got[period:]
+    assert (valid > 0).all()
+    # ATR은 평균 일중 범위보다 작을 수 없는 구조는 아니지만, 같은 스케일이어야 함
+    avg_range = float((df["high"] - df["low"]).mean())
+    assert valid[-1] < avg_range * 3
+
+
+def test_sma_kernel_matches_rolling_mean():
+    """누적합 SMA가 rolling(w).mean()과 동일한지 확인합니다."""
+    rng = np.random.default_rng(7)
+    arr = rng.random(80) * 100
+
+    for window in (5, 20, 60):
+        ref = pd.Series(arr).rolling(window).mean().to_numpy()
+        got = sma_kernel(arr, window)
+        assert np.allclose(ref, got, equal_nan=True)
+
+    # 데이터가 창보다 짧으면 전부 NaN
+    assert np.isnan(sma_kernel(arr[:3], 5)).all()